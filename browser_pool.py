@@ -0,0 +1,147 @@
+"""
+browser_pool.py
+
+Keeps WebDriver sessions alive between job application runs.
+
+Starting a browser and logging in costs several seconds per run. Backends acquire a
+driver from the shared pool instead of creating one, and release it back when done
+instead of calling driver.quit(). The pool remembers which sites each session is
+already logged in to, so later runs in the same process can skip the login flow.
+Each session runs with its own persistent browser profile under PROFILE_ROOT, so
+login cookies also survive restarts. Pooled drivers are quit when the interpreter exits.
+"""
+
+import atexit
+import itertools
+import logging
+import os
+import threading
+from typing import Dict, List, Set, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from common import PROFILE_ROOT, make_driver
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """
+    A small pool of idle WebDriver sessions keyed by browser name and whether the
+    session records the network performance log.
+    """
+
+    def __init__(self) -> None:
+        self._idle: Dict[Tuple[str, bool], List[WebDriver]] = {}
+        self._idle_keys: Dict[str, Tuple[str, bool]] = {}
+        self._drivers: Dict[str, WebDriver] = {}
+        self._browser_names: Dict[str, str] = {}
+        self._logged_in: Dict[str, Set[str]] = {}
+        # Profile directory slots in use per browser, and the slot of each session.
+        self._profile_slots: Dict[str, Set[int]] = {}
+        self._session_slots: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, browser_name: str, performance_log: bool = False) -> WebDriver:
+        """
+        Return an idle driver for browser_name, or create a new one if none is available.
+        Only sessions that need to read network responses should ask for performance_log.
+        Idle drivers that no longer respond are discarded.
+        """
+        key = (browser_name, performance_log)
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                driver = idle.pop() if idle else None
+            if driver is None:
+                break
+            try:
+                driver.current_url  # Cheap liveness check
+                logger.debug("Reusing pooled %s session %s", browser_name, driver.session_id)
+                return driver
+            except Exception as e:
+                logger.debug("Discarding dead pooled session: %s", e)
+                self.discard(driver)
+
+        # Browsers lock their profile directory, so concurrent sessions each get a slot.
+        with self._lock:
+            slots = self._profile_slots.setdefault(browser_name, set())
+            slot = next(i for i in itertools.count() if i not in slots)
+            slots.add(slot)
+        try:
+            driver = make_driver(browser_name, os.path.join(PROFILE_ROOT, browser_name, str(slot)),
+                                 performance_log=performance_log)
+        except Exception:
+            with self._lock:
+                slots.discard(slot)
+            raise
+        with self._lock:
+            self._session_slots[driver.session_id] = slot
+            self._drivers[driver.session_id] = driver
+            self._browser_names[driver.session_id] = browser_name
+            self._idle_keys[driver.session_id] = key
+            self._logged_in[driver.session_id] = set()
+        logger.debug("Started new %s session %s", browser_name, driver.session_id)
+        return driver
+
+    def release(self, driver: WebDriver) -> None:
+        """
+        Return a driver to the pool so a later acquire() can reuse it.
+        Releasing a driver that is already idle has no effect.
+        """
+        with self._lock:
+            key = self._idle_keys.get(driver.session_id)
+            if key is None:
+                return
+            idle = self._idle.setdefault(key, [])
+            if driver not in idle:
+                idle.append(driver)
+
+    def discard(self, driver: WebDriver) -> None:
+        """
+        Quit a driver and forget about it.
+        """
+        with self._lock:
+            session_id = driver.session_id
+            self._drivers.pop(session_id, None)
+            browser_name = self._browser_names.pop(session_id, None)
+            self._logged_in.pop(session_id, None)
+            slot = self._session_slots.pop(session_id, None)
+            key = self._idle_keys.pop(session_id, None)
+            if key and driver in self._idle.get(key, []):
+                self._idle[key].remove(driver)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug("Error quitting driver: %s", e)
+        # Free the profile slot only once the browser has let go of the directory.
+        if browser_name and slot is not None:
+            with self._lock:
+                self._profile_slots[browser_name].discard(slot)
+
+    def is_logged_in(self, driver: WebDriver, site: str) -> bool:
+        """
+        Return True if the driver's session has already logged in to site.
+        """
+        return site in self._logged_in.get(driver.session_id, set())
+
+    def mark_logged_in(self, driver: WebDriver, site: str) -> None:
+        """
+        Record that the driver's session is logged in to site.
+        """
+        with self._lock:
+            self._logged_in.setdefault(driver.session_id, set()).add(site)
+
+    def close_all(self) -> None:
+        """
+        Quit every driver owned by the pool.
+        """
+        with self._lock:
+            drivers = list(self._drivers.values())
+        for driver in drivers:
+            self.discard(driver)
+        logger.info("Closed %d pooled browser session(s).", len(drivers))
+
+
+pool = BrowserPool()
+atexit.register(pool.close_all)
@@ -0,0 +1,476 @@
+"""
+common.py
+
+Helpers shared by the LinkedIn and Indeed backends.
+
+Holds the WebDriver factory used by the browser pool, the Selenium helpers
+(explicit waits, robust clicks and fuzzy placeholder lookup) that both backends use,
+and the site-independent parts of an application run: answering the question form
+and applying to a list of job links, alone or from a worker thread.
+The logging setup and secrets.config reader live in settings.py and are re-exported
+here for the backends.
+"""
+
+import difflib
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+from urllib.parse import urlparse
+
+from selenium import webdriver
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.common.by import By
+
+import config
+import settings
+from db_handler import flush_answers, load_answers, save_answers
+
+logger = logging.getLogger(__name__)
+
+# Re-exported so the backends can keep importing every shared helper from common.
+configure_logging = settings.configure_logging
+read_secrets = settings.read_secrets
+
+# Browser used when a backend is not told otherwise (see DRIVER_FACTORIES); set in config.py.
+DEFAULT_BROWSER = getattr(config, "browser", "chrome")
+
+# Default timeout (seconds) for explicit waits on page elements.
+WAIT_TIMEOUT = 15
+# Short timeout for elements that are frequently absent (e.g. apply buttons).
+NEGATIVE_WAIT_TIMEOUT = 2
+# Seconds between polls of an explicit wait (Selenium defaults to 0.5).
+WAIT_POLL_FREQUENCY = 0.2
+# Errors caused by the page re-rendering under us; retry() tries again on these.
+TRANSIENT_ERRORS = (StaleElementReferenceException, NoSuchElementException, TimeoutException)
+
+T = TypeVar("T")
+
+# Implicit waits are disabled for every driver created by make_driver().
+# Mixing them with explicit waits makes every empty find_elements() call inside
+# a WebDriverWait poll block for the implicit timeout, so all waiting is done
+# through WebDriverWait, with NEGATIVE_WAIT_TIMEOUT bounding the absent case.
+
+# Maximum number of HTTP connections kept open to each driver service.
+DRIVER_CONNECTION_POOL_SIZE = 10
+
+# Resume uploaded with every application; resolved once at import instead of per job.
+RESUME_PATH = str(Path("Resources", "resume.pdf").resolve())
+
+# Browser profiles live here, one directory per pooled session (see BrowserPool).
+PROFILE_ROOT = os.path.expanduser(os.path.join("~", ".autojobapplier"))
+
+# Image, font, analytics and ad URL patterns blocked in Chrome sessions; none are needed to apply.
+BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.woff*",
+    "*.ttf",
+    "*doubleclick.net*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*adsystem.amazon*",
+    "*linkedin.com/li/track*",
+    "*bat.bing.com*",
+]
+
+
+def make_chrome_driver(headless: bool = True, profile_dir: Optional[str] = None,
+                       performance_log: bool = False) -> WebDriver:
+    """
+    Create a Chrome driver tuned for unattended automation.
+    Runs headless without GPU compositing, extensions or image loading, which
+    cuts paint work and bytes downloaded on image-heavy job result pages.
+    Images, web fonts, analytics and ad domains are blocked through the DevTools protocol.
+    Navigations do not wait for subresources to finish loading.
+    With performance_log, network events are kept in the performance log; chromedriver
+    buffers them until read, so only sessions that read get_log("performance") ask for it.
+    With profile_dir the browser profile (and its login cookies) persists between runs.
+    """
+    options = webdriver.ChromeOptions()
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--disable-extensions")
+    # A tall viewport lets more result cards render without scrolling.
+    options.add_argument("--window-size=1280,2000")
+    # driver.get() returns at DOMContentLoaded; every lookup after a navigation is an explicit wait.
+    options.page_load_strategy = "eager"
+    if performance_log:
+        # Record network events so backends can read API responses (see get_log("performance")).
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    driver = webdriver.Chrome(options=options)
+    # Block tracker and ad requests before the first navigation.
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    return driver
+
+
+# Maps a browser name to a callable that creates a new driver for it. Each factory
+# takes an optional profile directory and performance_log flag; Safari always uses
+# the user's own profile and has no performance log.
+DRIVER_FACTORIES: Dict[str, Callable[..., WebDriver]] = {
+    "chrome": make_chrome_driver,
+    "safari": lambda profile_dir=None, performance_log=False: webdriver.Safari(),
+}
+
+
+def widen_connection_pool(driver: WebDriver, maxsize: int = DRIVER_CONNECTION_POOL_SIZE) -> None:
+    """
+    Raise the urllib3 connection pool size used for commands sent to the driver.
+
+    Selenium's RemoteConnection keeps a single connection per host by default, so
+    back-to-back or concurrent commands serialize and log "connection pool is full"
+    warnings. The existing PoolManager keeps its timeout and certificate settings;
+    only the per-host maxsize is raised and any already-created pools are dropped.
+    """
+    conn = getattr(driver.command_executor, "_conn", None)
+    if conn is None or not hasattr(conn, "connection_pool_kw"):
+        logger.debug("Driver connection does not expose a urllib3 PoolManager; leaving it unchanged")
+        return
+    conn.connection_pool_kw["maxsize"] = maxsize
+    conn.clear()
+
+
+def make_driver(browser: str = DEFAULT_BROWSER, profile_dir: Optional[str] = None,
+                performance_log: bool = False) -> WebDriver:
+    """
+    Create a new driver for browser (a DRIVER_FACTORIES key) ready for automation:
+    a wider HTTP connection pool and implicit waits disabled.
+    profile_dir, if given, is the browser profile to run with; performance_log
+    enables the network performance log where the browser supports it.
+    """
+    driver = DRIVER_FACTORIES[browser](profile_dir=profile_dir, performance_log=performance_log)
+    widen_connection_pool(driver)
+    driver.implicitly_wait(0)
+    return driver
+
+
+@lru_cache(maxsize=1)
+def resume_available() -> bool:
+    """
+    Return True if the resume at RESUME_PATH exists. Checked once per process, so a
+    missing resume is reported with a single warning instead of once per job.
+    """
+    if Path(RESUME_PATH).is_file():
+        return True
+    logger.warning("Resume not found at %s; applying without attaching it", RESUME_PATH)
+    return False
+
+
+# Single daemon thread that owns stdin: prompts from every worker are asked one at a
+# time. Being a daemon, it never keeps the process alive (e.g. after Ctrl-C) to ask
+# prompts that are still queued.
+_prompt_queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+_prompt_thread: Optional[threading.Thread] = None
+_prompt_thread_lock = threading.Lock()
+
+
+def _prompt_loop() -> None:
+    """
+    Ask queued prompts one by one, skipping any whose Future was cancelled meanwhile.
+    """
+    while True:
+        prompt, future = _prompt_queue.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(input(prompt))
+        except BaseException as e:
+            future.set_exception(e)
+
+
+def ask_user(prompt: str) -> "Future[str]":
+    """
+    Queue an input() prompt on the prompt thread and return a Future with the reply.
+    Callers can keep driving the browser and collect the answer when they need it,
+    and should cancel() replies they no longer need so the user is not asked.
+    """
+    global _prompt_thread
+    with _prompt_thread_lock:
+        if _prompt_thread is None:
+            _prompt_thread = threading.Thread(target=_prompt_loop, name="prompt", daemon=True)
+            _prompt_thread.start()
+    future: "Future[str]" = Future()
+    _prompt_queue.put((prompt, future))
+    return future
+
+
+def make_wait(driver: WebDriver, timeout: float = WAIT_TIMEOUT) -> WebDriverWait:
+    """
+    Return a WebDriverWait polling every WAIT_POLL_FREQUENCY seconds. Build one per
+    page flow and reuse it for every condition in that flow.
+    """
+    return WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY)
+
+
+def wait_until(driver: WebDriver, condition: Callable[[WebDriver], T], timeout: float = WAIT_TIMEOUT) -> T:
+    """
+    Wait until condition returns a truthy value and return it.
+    Raises TimeoutException if that does not happen within timeout seconds.
+    """
+    return make_wait(driver, timeout).until(condition)
+
+
+def wait_for(driver: WebDriver, locator: Tuple[str, str], timeout: float = WAIT_TIMEOUT):
+    """
+    Wait until an element matching locator is present and return it.
+    Raises TimeoutException if it does not appear within timeout seconds.
+    """
+    return wait_until(driver, EC.presence_of_element_located(locator), timeout)
+
+
+# Returns [element, placeholder] for every <input> on the page that has a placeholder.
+PLACEHOLDERS_JS = (
+    "return Array.from(document.querySelectorAll('input[placeholder]'))"
+    ".filter(e => e.placeholder).map(e => [e, e.placeholder]);"
+)
+
+# Returns the href of every element matching the CSS selector in arguments[0].
+JOB_LINKS_JS = "return Array.from(document.querySelectorAll(arguments[0])).map(a => a.href);"
+
+# Tags the first input/textarea of each question group (arguments[0] is the group
+# CSS selector) with a data-auto-idx attribute and returns [index, label text] pairs.
+QUESTION_FIELDS_JS = """
+const out = [];
+document.querySelectorAll(arguments[0]).forEach((g, gi) => {
+  const label = g.querySelector('label');
+  const input = g.querySelector('input, textarea');
+  if (label && input) {
+    input.setAttribute('data-auto-idx', gi);
+    out.push([gi, label.innerText.trim()]);
+  }
+});
+return out;
+"""
+
+# (page path, target placeholder) -> CSS selector of the input matched last time.
+_fuzzy_cache: Dict[Tuple[str, str], str] = {}
+
+
+def find_element_fuzzy(driver: WebDriver, target_placeholder: str, cutoff: float = 0.5):
+    """
+    Look for an <input> element whose placeholder attribute is a close match to target_placeholder.
+    Uses difflib.SequenceMatcher to compute a similarity ratio.
+    Returns the element if a candidate meets the cutoff; otherwise raises an exception.
+    Matches are remembered per page path, so repeated lookups on the same page
+    resolve the remembered selector directly instead of rescanning.
+    """
+    cache_key = (urlparse(driver.current_url).path, target_placeholder)
+    cached_selector = _fuzzy_cache.get(cache_key)
+    if cached_selector:
+        try:
+            return driver.find_element(By.CSS_SELECTOR, cached_selector)
+        except NoSuchElementException:
+            _fuzzy_cache.pop(cache_key, None)
+
+    # Collect every (element, placeholder) pair in a single round-trip instead of
+    # calling get_attribute() on each <input> separately; the winning element
+    # comes back with it, so no second lookup is needed.
+    candidates = driver.execute_script(PLACEHOLDERS_JS)
+    # Reuse one matcher so the index on the (constant) target is built only once.
+    matcher = difflib.SequenceMatcher(None, autojunk=False)
+    matcher.set_seq2(target_placeholder.lower())
+    target_len = len(target_placeholder)
+    best_element = None
+    best_placeholder = None
+    best_ratio = 0.0
+    for element, placeholder in candidates:
+        # ratio() is at most 2*min(len)/(sum of lens), so skip lengths that can never reach cutoff.
+        placeholder_len = len(placeholder)
+        if 2 * min(placeholder_len, target_len) < cutoff * (placeholder_len + target_len):
+            continue
+        matcher.set_seq1(placeholder.lower())
+        # Cheap upper bounds first; skip candidates that cannot beat the current best.
+        if matcher.real_quick_ratio() <= best_ratio or matcher.quick_ratio() <= best_ratio:
+            continue
+        ratio = matcher.ratio()
+        if ratio > best_ratio:
+            best_ratio = ratio
+            best_element = element
+            best_placeholder = placeholder
+    logger.debug("Best match for placeholder '%s' is '%s' with ratio %f",
+                 target_placeholder, best_placeholder, best_ratio)
+    if best_element is not None and best_ratio >= cutoff:
+        escaped = best_placeholder.replace("\\", "\\\\").replace("'", "\\'")
+        _fuzzy_cache[cache_key] = f"input[placeholder='{escaped}']"
+        return best_element
+    else:
+        raise Exception(f"No element with placeholder close to '{target_placeholder}' found (best ratio: {best_ratio})")
+
+
+def fast_type(driver: WebDriver, element, text: str) -> None:
+    """
+    Type text into element with a single CDP Input.insertText call, so the page gets
+    one input event instead of synthesized key events for every character.
+    Falls back to send_keys on drivers without CDP (e.g. Safari) or if CDP fails.
+    """
+    if hasattr(driver, "execute_cdp_cmd"):
+        try:
+            driver.execute_script("arguments[0].focus();", element)
+            driver.execute_cdp_cmd("Input.insertText", {"text": text})
+            return
+        except Exception as e:
+            logger.debug("CDP text insertion failed: %s; using send_keys", e)
+    element.send_keys(text)
+
+
+def retry(fn: Callable[[], T], attempts: int = 3, base: float = 0.2) -> T:
+    """
+    Call fn, retrying on TRANSIENT_ERRORS with exponential backoff (base, 2*base, ...).
+    The last error is re-raised once all attempts fail.
+    """
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except TRANSIENT_ERRORS as e:
+            if attempt == attempts - 1:
+                raise
+            delay = base * (2 ** attempt)
+            logger.debug("Transient error (%s); retrying in %.1fs", type(e).__name__, delay)
+            time.sleep(delay)
+
+
+def click_element(driver: WebDriver, element):
+    """
+    Attempt a normal click on the element; if that fails, use JavaScript to click.
+    """
+    try:
+        element.click()
+    except Exception as e:
+        logger.debug("Standard click failed: %s; using JavaScript click", e)
+        driver.execute_script("arguments[0].click();", element)
+
+
+def click_locator(driver: WebDriver, locator: Tuple[str, str]) -> None:
+    """
+    Find the element matching locator and click it (see click_element). Finding it on
+    every call means retry(lambda: click_locator(driver, locator)) never reuses an
+    element the page has since re-rendered.
+    """
+    click_element(driver, driver.find_element(*locator))
+
+
+def _fill_question(driver: WebDriver, group_index: int, answer: str) -> None:
+    """
+    Type answer into the input tagged with group_index by QUESTION_FIELDS_JS.
+    """
+    try:
+        input_field = driver.find_element(By.CSS_SELECTOR, f"[data-auto-idx='{group_index}']")
+        input_field.clear()
+        fast_type(driver, input_field, answer)
+    except Exception as qe:
+        logger.debug("Error processing question group: %s", qe)
+
+
+def process_application_questions(driver: WebDriver, question_group_css: str) -> None:
+    """
+    Process the application questions in the open application form, one question per
+    element matching question_group_css.
+    For each question, check the local SQLite database for an answer.
+    If not found, prompt the user without blocking the other fields; new answers
+    are saved together once the form is done.
+    """
+    new_answers = []
+    pending = {}
+    try:
+        question_fields = driver.execute_script(QUESTION_FIELDS_JS, question_group_css)
+        logger.debug("Found %d question groups", len(question_fields))
+        if not question_fields:
+            # Most steps only ask for the resume; don't touch the answer store at all.
+            return
+        # Look up the stored answers for this form's questions (served from memory).
+        answers = load_answers(text for _, text in question_fields if text)
+        # Fill known answers right away; unknown questions are asked on the prompt
+        # thread in the meantime and filled in once the user has replied.
+        for group_index, question_text in question_fields:
+            if not question_text:
+                continue
+            if question_text in answers:
+                logger.info("Using stored answer for question: %s", question_text)
+                _fill_question(driver, group_index, answers[question_text])
+            else:
+                if question_text not in pending:
+                    pending[question_text] = (ask_user(f"Enter answer for '{question_text}': "), [])
+                pending[question_text][1].append(group_index)
+        for question_text, (reply, group_indexes) in pending.items():
+            answer = reply.result()
+            answers[question_text] = answer
+            new_answers.append((question_text, answer))
+            for group_index in group_indexes:
+                _fill_question(driver, group_index, answer)
+    except Exception as e:
+        logger.error("Error processing application questions: %s", e)
+    finally:
+        # Don't leave prompts queued for a form we are no longer filling (e.g. after Ctrl-C).
+        for reply, _ in pending.values():
+            reply.cancel()
+        try:
+            if new_answers:
+                # One transaction per form, so answers survive the process being killed.
+                save_answers(new_answers)
+                flush_answers()
+                logger.info("Saved %d new answer(s)", len(new_answers))
+        except Exception as e:
+            logger.error("Error saving new answers: %s", e)
+
+
+# A backend's per-job step: (driver, index, auto_apply) applies to the job page open in driver.
+ApplyToOpenJob = Callable[[WebDriver, int, bool], None]
+
+
+def apply_to_job_links(driver: WebDriver, indexed_links: List[Tuple[int, str]], apply_to_open_job: ApplyToOpenJob,
+                       auto_apply: bool = True, before_each: Optional[Callable[[WebDriver], None]] = None) -> None:
+    """
+    Open each (index, link) job posting directly in driver and apply to it with
+    apply_to_open_job. before_each, if given, is called with the driver before every
+    job page is opened.
+    """
+    for index, link in indexed_links:
+        logger.info("Processing job posting #%d", index + 1)
+        if before_each is not None:
+            before_each(driver)
+        try:
+            driver.get(link)
+        except Exception as job_error:
+            logger.error("Error opening job #%d: %s", index + 1, job_error)
+            continue
+        apply_to_open_job(driver, index, auto_apply)
+
+
+def apply_to_job_links_worker(indexed_links: List[Tuple[int, str]], auto_apply: bool, browser: str,
+                              apply_to_open_job: ApplyToOpenJob,
+                              ensure_logged_in: Callable[[WebDriver], None]) -> None:
+    """
+    Worker used by the backends' apply_to_jobs when running with several workers.
+    Acquires its own pooled driver, logs in with ensure_logged_in and applies to each job link.
+    """
+    # Imported here because browser_pool builds its drivers with make_driver from this module.
+    from browser_pool import pool
+
+    driver = pool.acquire(browser)
+    try:
+        ensure_logged_in(driver)
+        apply_to_job_links(driver, indexed_links, apply_to_open_job, auto_apply)
+    except Exception as worker_error:
+        logger.error("Worker stopped on an error: %s", worker_error)
+    finally:
+        pool.release(driver)
@@ -1,6 +1,9 @@
 # wait time for page loading, increase this to like 5 seconds if you have a slow internet connection
 load_delay = 1.5
 
+# browser used by the backends: 'chrome' (headless) or 'safari'
+browser = 'chrome'
+
 # apply personal answers
 add_address = 'My Address'  # your address
 add_phone = '0123456789'  # your phone number
@@ -1,33 +1,158 @@
+import atexit
 import os
 import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Resolved once at import; relative to the directory the bot is started from.
+DB_PATH = os.path.abspath(os.path.join("Resources", "questions.db"))
+
+# Shared connection, opened lazily by get_db_connection() and reused for the whole process.
+_conn: Optional[sqlite3.Connection] = None
+_db_created = False
+# Serializes write transactions on the shared connection across worker threads.
+_write_lock = threading.Lock()
+# Every stored answer (question -> answer), loaded once by _answer_cache().
+_answers: Optional[Dict[str, str]] = None
+# New (question, answer) pairs not yet written; flushed by flush_answers() after each
+# form and, as a backstop, at exit.
+_pending: List[Tuple[str, str]] = []
+
+# Schema version stored in PRAGMA user_version. Version 1 made questions a WITHOUT ROWID
+# table, so rows live in the primary key B-tree instead of behind a separate index.
+SCHEMA_VERSION = 1
+_CREATE_SQL = f"""
+BEGIN;
+CREATE TABLE IF NOT EXISTS questions (
+    question TEXT PRIMARY KEY,
+    answer TEXT
+) WITHOUT ROWID;
+PRAGMA user_version = {SCHEMA_VERSION};
+COMMIT;
+"""
+# Rebuilds a version 0 (rowid) questions table in place, keeping its rows.
+_MIGRATE_SQL = f"""
+BEGIN;
+CREATE TABLE questions_new (
+    question TEXT PRIMARY KEY,
+    answer TEXT
+) WITHOUT ROWID;
+INSERT INTO questions_new (question, answer) SELECT question, answer FROM questions;
+DROP TABLE questions;
+ALTER TABLE questions_new RENAME TO questions;
+PRAGMA user_version = {SCHEMA_VERSION};
+COMMIT;
+"""
+
+# SQL issued on the shared connection. Passing the same string objects every time lets
+# sqlite3's per-connection statement cache reuse the compiled statements.
+_SELECT_ALL_SQL = "SELECT question, answer FROM questions"
+_INSERT_SQL = "INSERT OR IGNORE INTO questions (question, answer) VALUES (?, ?)"
 
 def get_db_path() -> str:
     """
     Returns the absolute path to the questions database file.
     """
-    return os.path.abspath(os.path.join("Resources", "questions.db"))
+    return DB_PATH
 
-def create_db() -> None:
+def create_db(conn: Optional[sqlite3.Connection] = None) -> None:
     """
-    Creates the questions database and its table if they do not exist.
+    Creates the questions database and its table if they do not exist, and migrates
+    a table from an older schema version. Runs on conn when given, otherwise on a
+    short-lived connection. The check only runs once per process.
     """
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS questions (
-            question TEXT PRIMARY KEY,
-            answer TEXT
-        )
-    """)
-    conn.commit()
-    conn.close()
+    global _db_created
+    if _db_created:
+        return
+    own_conn = conn is None
+    if own_conn:
+        conn = sqlite3.connect(get_db_path())
+    if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        table_exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'questions'"
+        ).fetchone()
+        conn.executescript(_MIGRATE_SQL if table_exists else _CREATE_SQL)
+    if own_conn:
+        conn.close()
+    _db_created = True
 
 def get_db_connection() -> sqlite3.Connection:
     """
-    Returns a connection to the questions database.
-    Ensures the database and table exist.
+    Returns the shared connection to the questions database.
+    Ensures the database and table exist. The connection is opened once per
+    process in WAL mode and closed at interpreter exit (after writing any pending
+    answers), so callers must not close it.
+    """
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(get_db_path(), check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+            create_db(conn)  # Ensure the table exists, reusing this connection
+        except Exception:
+            # Don't keep a half-initialized connection; the next call starts over.
+            conn.close()
+            raise
+        _conn = conn
+        atexit.register(_close_connection)
+    return _conn
+
+def _close_connection() -> None:
+    """
+    Writes pending answers and closes the shared connection. Registered with atexit.
+    """
+    try:
+        flush_answers()
+    finally:
+        _conn.close()
+
+def _answer_cache() -> Dict[str, str]:
+    """
+    Returns the process-wide question -> answer cache, loading the whole table on first use.
+    """
+    global _answers
+    if _answers is None:
+        with _write_lock:
+            if _answers is None:
+                _answers = dict(get_db_connection().execute(_SELECT_ALL_SQL))
+    return _answers
+
+def load_answers(questions: Iterable[str]) -> Dict[str, str]:
+    """
+    Returns the stored answers for the given questions as a dict of question -> answer.
+    Unknown questions are absent from the result. Answers are served from memory;
+    the table is read once per process.
+    """
+    cache = _answer_cache()
+    return {question: cache[question] for question in questions if question in cache}
+
+def save_answers(new_answers: List[Tuple[str, str]]) -> None:
+    """
+    Adds newly collected (question, answer) pairs to the in-memory cache and queues
+    them for the database. Existing questions are left unchanged. The queue is written
+    in one transaction by flush_answers(); callers flush once their form is done, and
+    anything still queued is written at interpreter exit.
+    """
+    if not new_answers:
+        return
+    cache = _answer_cache()
+    with _write_lock:
+        for question, answer in new_answers:
+            if question not in cache:
+                cache[question] = answer
+                _pending.append((question, answer))
+
+def flush_answers() -> None:
+    """
+    Writes all queued answers to the database in a single transaction.
     """
-    create_db()  # Ensure the DB is set up before connecting
-    db_path = get_db_path()
-    return sqlite3.connect(db_path)
+    with _write_lock:
+        if not _pending:
+            return
+        conn = get_db_connection()
+        with conn:  # One commit for the whole batch
+            conn.executemany(_INSERT_SQL, _pending)
+        _pending.clear()
@@ -3,13 +3,27 @@
 indeed.py
 
 Main entry point for Indeed Job Application Automation.
+
+Usage:
+    python indeed.py [--workers K] [--pages N]
+
+The optional --workers flag processes the job postings with K browser sessions in parallel.
+The optional --pages flag collects postings from the first N result pages.
 """
 
+import argparse
+
 from indeed_backend import apply_to_jobs
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Indeed Job Application Automation")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of parallel browser sessions used to apply (default: 1)")
+    parser.add_argument("--pages", type=int, default=1,
+                        help="Number of search result pages to collect (default: 1)")
+    args = parser.parse_args()
 
     role = "Software Development Engineer"
     location = "United States"
     # You can customize the job title and location below or parse command-line args.
-    apply_to_jobs(role, location)
+    apply_to_jobs(role, location, workers=max(1, args.workers), pages=max(1, args.pages))
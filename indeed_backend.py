@@ -1,5 +1,5 @@
 """
-backend_indeed.py
+indeed_backend.py
 
 Backend module for Indeed Job Application Automation.
 
@@ -9,85 +9,82 @@ jobs page, searches for jobs based on a keyword and location, and if an "Apply N
 button is present, processes the application questions (if any) and submits the application.
 """
 
-import difflib
 import logging
-import os
-import time
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from urllib.parse import parse_qs, urlencode, urlparse
 
-from selenium import webdriver
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from db_handler import get_db_connection
-
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[logging.StreamHandler()]
+from browser_pool import pool
+from common import (
+    DEFAULT_BROWSER,
+    JOB_LINKS_JS,
+    NEGATIVE_WAIT_TIMEOUT,
+    RESUME_PATH,
+    apply_to_job_links,
+    apply_to_job_links_worker,
+    click_element,
+    click_locator,
+    fast_type,
+    configure_logging,
+    find_element_fuzzy,
+    make_wait,
+    process_application_questions,
+    read_secrets,
+    resume_available,
+    retry,
+    wait_for,
 )
-logger = logging.getLogger(__name__)
 
+configure_logging()
+logger = logging.getLogger(__name__)
 
-def read_secrets(file_path: str = "secrets.config") -> Dict[str, str]:
+# Placeholder selector for a question group; may need updating to the actual page structure.
+QUESTION_GROUP_CSS = "div.indeed-apply-form-section"
+
+# Locators used inside the job loop, built once at import time.
+_LOWERCASE_TEXT = "translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+JOB_CARD = (By.CSS_SELECTOR, "a.tapItem")
+JOB_DESCRIPTION = (By.ID, "jobDescriptionText")
+APPLY_NOW_XPATH = (By.XPATH, f"//button[contains({_LOWERCASE_TEXT}, 'apply now')]")
+SUBMIT_XPATH = (By.XPATH, f"//button[contains({_LOWERCASE_TEXT}, 'submit')]")
+APPLY_MODAL = (By.CSS_SELECTOR, "div.indeed-apply-modal")
+FILE_INPUT = (By.CSS_SELECTOR, "input[type='file']")
+# innerText skips the per-node visibility checks WebElement.text does in the browser.
+INNER_TEXT_JS = "return arguments[0].innerText;"
+# Indeed shows this many postings per result page (the step of the start= offset).
+JOBS_PER_PAGE = 10
+JOB_VIEW_URL = "https://www.indeed.com/viewjob?jk={}"
+
+
+def results_page_url(url: str, start: int) -> str:
     """
-    Read Indeed credentials from a configuration file.
-    The file should contain lines like:
-        username_indeed=your_email@example.com
-        password_indeed=your_password
+    Return the search results URL url with its start offset set to start, whether or
+    not url already carries one (and wherever it appears in the query).
     """
-    logger.debug("Reading secrets from %s", file_path)
-    secrets = {}
-    try:
-        with open(file_path, "r") as file:
-            for line in file:
-                line = line.strip()
-                if line and "=" in line:
-                    key, value = line.split("=", 1)
-                    secrets[key.strip()] = value.strip()
-        logger.info("Successfully read secrets from %s", file_path)
-    except Exception as e:
-        logger.error("Error reading secrets.config: %s", e)
-    return secrets
+    parts = urlparse(url)
+    query = parse_qs(parts.query)
+    query["start"] = [str(start)]
+    return parts._replace(query=urlencode(query, doseq=True)).geturl()
 
 
-def find_element_fuzzy(driver: WebDriver, target_placeholder: str, cutoff: float = 0.5):
+def unique_job_links(links: List[str]) -> List[str]:
     """
-    Look for an <input> element whose placeholder attribute is a close match to target_placeholder.
-    Uses difflib.SequenceMatcher to compute a similarity ratio.
-    Returns the element if a candidate meets the cutoff; otherwise raises an exception.
+    Reduce scraped card links to one canonical viewjob URL per posting (its jk job key),
+    in order. Sponsored postings are repeated across result pages, each time with its
+    own tracking parameters; links without a job key are kept as they are.
     """
-    candidates = driver.find_elements(By.TAG_NAME, "input")
-    best_match = None
-    best_ratio = 0.0
-    for elem in candidates:
-        placeholder = elem.get_attribute("placeholder")
-        if placeholder:
-            ratio = difflib.SequenceMatcher(None, placeholder.lower(), target_placeholder.lower()).ratio()
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_match = elem
-    logger.debug("Best match for placeholder '%s' is '%s' with ratio %f",
-                 target_placeholder, best_match.get_attribute("placeholder") if best_match else "None", best_ratio)
-    if best_match and best_ratio >= cutoff:
-        return best_match
-    else:
-        raise Exception(f"No element with placeholder close to '{target_placeholder}' found (best ratio: {best_ratio})")
-
-
-def click_element(driver: WebDriver, element):
-    """
-    Attempt a normal click on the element; if that fails, use JavaScript to click.
-    """
-    try:
-        element.click()
-    except Exception as e:
-        logger.debug("Standard click failed: %s; using JavaScript click", e)
-        driver.execute_script("arguments[0].click();", element)
+    seen = {}
+    for link in links:
+        if not link:
+            continue
+        job_key = parse_qs(urlparse(link).query).get("jk")
+        seen.setdefault(JOB_VIEW_URL.format(job_key[0]) if job_key else link, None)
+    return list(seen)
 
 
 def login_to_indeed(driver: WebDriver) -> None:
@@ -106,8 +103,7 @@ def login_to_indeed(driver: WebDriver) -> None:
     driver.get("https://secure.indeed.com/account/login")
     logger.debug("Navigated to Indeed login page")
 
-    wait = WebDriverWait(driver, 10)
-    wait = WebDriverWait(driver, 20)
+    wait = make_wait(driver)
     email_field = wait.until(EC.element_to_be_clickable((By.ID, "login-email-input")))
     email_field.clear()
     password_field = driver.find_element(By.ID, "login-password-input")
@@ -117,8 +113,6 @@ def login_to_indeed(driver: WebDriver) -> None:
     password_field.send_keys(Keys.RETURN)
     logger.info("Submitted login credentials")
 
-    time.sleep(3)  # Wait for login to process
-
     # Check for a successful login by waiting for a known element (e.g., profile icon)
     try:
         wait.until(EC.presence_of_element_located((By.ID, "userOptionsLabel")))
@@ -128,77 +122,110 @@ def login_to_indeed(driver: WebDriver) -> None:
         raise Exception("Login did not complete successfully.") from e
 
 
-def process_application_questions(driver: WebDriver) -> None:
+def ensure_logged_in(driver: WebDriver) -> None:
+    """
+    Log in to Indeed unless this pooled session has logged in before.
     """
-    Process application questions in the Easy Apply modal on Indeed.
-    For each question, check the local SQLite database for an answer.
-    If not found, prompt the user and save the answer.
-    
-    Note: The selectors below (e.g., 'div.indeed-apply-form-section')
-    are placeholders and may need to be updated according to the actual page structure.
+    if not pool.is_logged_in(driver, "indeed"):
+        login_to_indeed(driver)
+        pool.mark_logged_in(driver, "indeed")
+
+
+def apply_to_open_job(driver: WebDriver, index: int, auto_apply: bool = True) -> None:
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    Apply to the job posting currently shown in the driver.
+    Reads the description, clicks Apply Now if present, answers the application
+    questions, attaches the resume and submits. index is only used for logging.
+    """
+    wait = make_wait(driver)
     try:
-        question_groups = driver.find_elements(By.CSS_SELECTOR, "div.indeed-apply-form-section")
-        logger.debug("Found %d question groups", len(question_groups))
-        for group in question_groups:
-            try:
-                label_elem = group.find_element(By.TAG_NAME, "label")
-                question_text = label_elem.text.strip()
-                if not question_text:
-                    continue
-                # Attempt to find an input or textarea element within the group.
-                try:
-                    input_field = group.find_element(By.TAG_NAME, "input")
-                except Exception:
-                    input_field = group.find_element(By.TAG_NAME, "textarea")
+        # (Optional) Extract a snippet of the job description.
+        try:
+            description_elem = wait_for(driver, JOB_DESCRIPTION)
+            description = driver.execute_script(INNER_TEXT_JS, description_elem)
+        except Exception as e:
+            logger.error("Could not extract job description for job #%d: %s", index + 1, e)
+            description = "Unknown"
 
-                cursor.execute("SELECT answer FROM questions WHERE question = ?", (question_text,))
-                row = cursor.fetchone()
-                if row:
-                    answer = row[0]
-                    logger.info("Using stored answer for question: %s", question_text)
+        # Check for the presence of an Apply Now button.
+        try:
+            apply_button = wait_for(driver, APPLY_NOW_XPATH, NEGATIVE_WAIT_TIMEOUT)
+        except Exception:
+            apply_button = None
+        if apply_button:
+            logger.info("Apply Now button found for job #%d", index + 1)
+            if auto_apply:
+                try:
+                    retry(lambda: click_locator(driver, APPLY_NOW_XPATH))
+                    logger.debug("Clicked Apply Now button for job #%d", index + 1)
+                except Exception as e:
+                    logger.error("Failed to click Apply Now: %s", e)
+                # Wait for the application modal or form to appear.
+                wait.until(EC.visibility_of_element_located(APPLY_MODAL))
+                process_application_questions(driver, QUESTION_GROUP_CSS)
+
+                # Optionally attach your resume. find_elements returns [] at once when there
+                # is no upload field, instead of raising after the retries.
+                uploads = driver.find_elements(*FILE_INPUT) if resume_available() else []
+                if uploads:
+                    try:
+                        retry(lambda: driver.find_element(*FILE_INPUT).send_keys(RESUME_PATH))
+                        logger.info("Attached resume from %s for job #%d", RESUME_PATH, index + 1)
+                    except Exception as resume_error:
+                        logger.debug("Could not attach resume for job #%d: %s", index + 1, resume_error)
                 else:
-                    answer = input(f"Enter answer for '{question_text}': ")
-                    cursor.execute("INSERT INTO questions (question, answer) VALUES (?, ?)", (question_text, answer))
-                    conn.commit()
-                    logger.info("Saved answer for question: %s", question_text)
-                input_field.clear()
-                input_field.send_keys(answer)
-            except Exception as qe:
-                logger.debug("Error processing question group: %s", qe)
-    except Exception as e:
-        logger.error("Error processing application questions: %s", e)
-    finally:
-        conn.close()
-        logger.debug("Closed questions database connection")
-
+                    logger.debug("No resume upload field found for job #%d", index + 1)
 
-def apply_to_jobs(job_title: str, location: str, auto_apply: bool = True) -> None:
+                # Attempt to submit the application.
+                try:
+                    # The wait already polls for the button; only the click needs retrying.
+                    submit_button = wait.until(EC.element_to_be_clickable(SUBMIT_XPATH))
+                    retry(lambda: click_locator(driver, SUBMIT_XPATH))
+                    wait.until(EC.staleness_of(submit_button))
+                    logger.info("Submitted application for job #%d", index + 1)
+                except Exception as submit_error:
+                    logger.error("Could not submit application for job #%d: %s", index + 1, submit_error)
+            else:
+                logger.info("Auto-apply disabled for job #%d", index + 1)
+        else:
+            logger.info("Apply Now not available for job #%d", index + 1)
+    except Exception as job_error:
+        logger.error("Error processing job #%d: %s", index + 1, job_error)
+
+
+def apply_to_jobs(job_title: str, location: str, auto_apply: bool = True, workers: int = 1,
+                  browser: str = DEFAULT_BROWSER, pages: int = 1) -> None:
     """
     Automate job search and application on Indeed.
     Searches for jobs matching the given job_title and location.
     If an Apply Now button is available, processes the application questions and submits the application.
+    browser selects the driver from the browser pool ("chrome" runs headless, or "safari").
+    With workers > 1 the postings are split across that many browser sessions, each
+    opening its share of job links directly (requires a browser that allows several
+    automation sessions at once, e.g. the default headless "chrome"; Safari allows only one).
+    pages is the number of result pages to collect; later pages are opened directly by URL.
     """
     logger.info("Starting job application process for '%s' jobs in '%s'", job_title, location)
 
     try:
-        driver = webdriver.Safari()  # Adjust the driver (Chrome, Firefox, etc.) as needed.
-        logger.debug("Initialized Safari WebDriver")
+        driver = pool.acquire(browser)
+        logger.debug("Acquired %s WebDriver from the browser pool", browser)
     except Exception as e:
-        logger.error("Failed to initialize Safari WebDriver: %s", e)
+        logger.error("Failed to initialize %s WebDriver: %s", browser, e)
         return
 
+    # Job link shards for the workers; filled only when workers > 1.
+    shards = []
     try:
-        # Log in to Indeed
-        login_to_indeed(driver)
+        # Log in to Indeed unless this pooled session already has
+        ensure_logged_in(driver)
 
         # Navigate to the Indeed jobs page
         driver.get("https://www.indeed.com/jobs")
         logger.debug("Navigated to Indeed jobs page")
         driver.execute_script("window.scrollTo(0,0);")
-        wait = WebDriverWait(driver, 30)
+        wait = make_wait(driver)
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder]")))
 
         # --- UPDATE THE TARGET STRINGS AS NEEDED ---
         # The Indeed job search page usually contains two input boxes:
@@ -209,7 +236,7 @@ def apply_to_jobs(job_title: str, location: str, auto_apply: bool = True) -> Non
         # Locate the job title (what) search box using fuzzy matching.
         try:
             what_box = find_element_fuzzy(driver, what_target, cutoff=0.5)
-            wait.until(EC.element_to_be_clickable((By.XPATH, f"//input[@placeholder='{what_box.get_attribute('placeholder')}']")))
+            wait.until(EC.element_to_be_clickable(what_box))
             logger.debug("Found job title search box with placeholder: '%s'", what_box.get_attribute("placeholder"))
         except Exception as e:
             logger.error("Failed to locate job title search box: %s", e)
@@ -218,7 +245,7 @@ def apply_to_jobs(job_title: str, location: str, auto_apply: bool = True) -> Non
         # Locate the location (where) search box using fuzzy matching.
         try:
             where_box = find_element_fuzzy(driver, where_target, cutoff=0.5)
-            wait.until(EC.element_to_be_clickable((By.XPATH, f"//input[@placeholder='{where_box.get_attribute('placeholder')}']")))
+            wait.until(EC.element_to_be_clickable(where_box))
             logger.debug("Found location search box with placeholder: '%s'", where_box.get_attribute("placeholder"))
         except Exception as e:
             logger.error("Failed to locate location search box: %s", e)
@@ -231,7 +258,7 @@ def apply_to_jobs(job_title: str, location: str, auto_apply: bool = True) -> Non
             logger.error("Error clicking job title box: %s", click_error)
             raise
         what_box.clear()
-        what_box.send_keys(job_title)
+        fast_type(driver, what_box, job_title)
         logger.info("Entered job title: '%s'", job_title)
 
         # Enter the location.
@@ -241,92 +268,56 @@ def apply_to_jobs(job_title: str, location: str, auto_apply: bool = True) -> Non
             logger.error("Error clicking location box: %s", click_error)
             raise
         driver.execute_script("arguments[0].value = '';", where_box)
-        where_box.send_keys(location)
+        fast_type(driver, where_box, location)
         where_box.send_keys(Keys.RETURN)
         logger.info("Submitted search criteria for '%s' in '%s'", job_title, location)
 
         # Wait for job results to load.
         try:
             # Indeed job cards are often anchor elements with the class "tapItem".
-            jobs = wait.until(EC.presence_of_all_elements_located(
-                (By.CSS_SELECTOR, "a.tapItem")
-            ))
-            logger.info("Found %d job postings", len(jobs))
+            wait.until(EC.presence_of_element_located(JOB_CARD))
+            # Snapshot every card's link in one script call. Visiting the links directly
+            # avoids stale card references and scrolling each card into view.
+            job_links = driver.execute_script(JOB_LINKS_JS, JOB_CARD[1])
+            # Open further result pages through the start offset instead of clicking "Next".
+            search_url = driver.current_url
+            for page in range(1, pages):
+                driver.get(results_page_url(search_url, page * JOBS_PER_PAGE))
+                try:
+                    wait.until(EC.presence_of_element_located(JOB_CARD))
+                except Exception:
+                    logger.info("No job postings on result page %d; stopping pagination", page + 1)
+                    break
+                job_links.extend(driver.execute_script(JOB_LINKS_JS, JOB_CARD[1]))
+            job_links = unique_job_links(job_links)
+            logger.info("Found %d job postings", len(job_links))
         except Exception as e:
             logger.error("Failed to locate job postings: %s", e)
             raise
+        indexed_links = [(index, link) for index, link in enumerate(job_links) if link]
 
-        # Process each job posting.
-        for index, job in enumerate(jobs):
-            logger.info("Processing job posting #%d", index + 1)
-            try:
-                driver.execute_script("arguments[0].scrollIntoView(true);", job)
-                time.sleep(1)
-                try:
-                    job.click()
-                    logger.debug("Clicked on job posting #%d using standard click", index + 1)
-                except Exception as click_error:
-                    logger.warning("Standard click failed: %s; using JS click", click_error)
-                    driver.execute_script("arguments[0].click();", job)
-                time.sleep(2)
-
-                # (Optional) Extract a snippet of the job description.
-                try:
-                    description_elem = driver.find_element(By.ID, "jobDescriptionText")
-                    description = description_elem.text
-                except Exception as e:
-                    logger.error("Could not extract job description for job #%d: %s", index + 1, e)
-                    description = "Unknown"
-
-                # Check for the presence of an Apply Now button.
-                apply_buttons = driver.find_elements(By.XPATH, "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'apply now')]")
-                if apply_buttons:
-                    logger.info("Apply Now button found for job #%d", index + 1)
-                    if auto_apply:
-                        try:
-                            click_element(driver, apply_buttons[0])
-                            logger.debug("Clicked Apply Now button for job #%d", index + 1)
-                        except Exception as e:
-                            logger.error("Failed to click Apply Now: %s", e)
-                        # Wait for the application modal or form to appear.
-                        wait.until(EC.visibility_of_element_located(
-                            (By.XPATH, "//div[contains(@class, 'indeed-apply-modal')]")
-                        ))
-                        time.sleep(1)
-                        process_application_questions(driver)
-
-                        # Optionally attach your resume.
-                        try:
-                            resume_upload = driver.find_element(By.XPATH, "//input[@type='file']")
-                            resume_path = os.path.abspath(os.path.join("Resources", "resume.pdf"))
-                            resume_upload.send_keys(resume_path)
-                            time.sleep(1)
-                            logger.info("Attached resume from %s for job #%d", resume_path, index + 1)
-                        except Exception as resume_error:
-                            logger.debug("No resume upload field found for job #%d: %s", index + 1, resume_error)
-
-                        # Attempt to submit the application.
-                        try:
-                            submit_button = driver.find_element(By.XPATH, "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'submit')]")
-                            click_element(driver, submit_button)
-                            time.sleep(2)
-                            logger.info("Submitted application for job #%d", index + 1)
-                        except Exception as submit_error:
-                            logger.error("Could not submit application for job #%d: %s", index + 1, submit_error)
-                    else:
-                        logger.info("Auto-apply disabled for job #%d", index + 1)
-                else:
-                    logger.info("Apply Now not available for job #%d", index + 1)
-
-            except Exception as job_error:
-                logger.error("Error processing job #%d: %s", index + 1, job_error)
-                continue
+        if workers > 1:
+            # Applied to by the workers once the search session is back in the pool.
+            shards = [indexed_links[i::workers] for i in range(workers)]
+            logger.info("Processing %d job postings with %d workers", len(indexed_links), workers)
+        else:
+            # Process each job posting.
+            apply_to_job_links(driver, indexed_links, apply_to_open_job, auto_apply)
 
     except Exception as main_error:
         logger.error("An error occurred during the job search process: %s", main_error)
     finally:
-        driver.quit()
-        logger.info("Closed browser session.")
+        pool.release(driver)
+        logger.info("Returned browser session to the pool.")
+
+    # The search session is back in the pool, so one of the workers can reuse it.
+    if not shards:
+        return
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for shard in shards:
+            if shard:
+                executor.submit(apply_to_job_links_worker, shard, auto_apply, browser,
+                                apply_to_open_job, ensure_logged_in)
 
 
 if __name__ == "__main__":
@@ -7,10 +7,11 @@ This script gathers user inputs and invokes the backend module to perform the au
 job search and application process on LinkedIn.
 
 Usage:
-    python linkedin.py [--debug]
+    python linkedin.py [--debug] [--workers K]
 
 The optional --debug flag sets the logging level to DEBUG, so detailed process information
-will be printed to the console.
+will be printed to the console. The optional --workers flag processes the job postings
+with K browser sessions in parallel.
 """
 
 import argparse
@@ -26,6 +27,8 @@ def main() -> None:
     """
     parser = argparse.ArgumentParser(description="LinkedIn Job Application Automation")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of parallel browser sessions used to apply (default: 1)")
     args = parser.parse_args()
     
     if args.debug:
@@ -43,7 +46,7 @@ def main() -> None:
     
     print(f"Searching for '{job_title}' jobs in '{location}' with auto-apply set to {auto_apply}.\n")
     
-    apply_to_jobs(job_title, location, auto_apply)
+    apply_to_jobs(job_title, location, auto_apply, workers=max(1, args.workers))
 
 if __name__ == '__main__':
     main()
@@ -1,5 +1,5 @@
 """
-backend.py
+linkedin_backend.py
 
 Backend module for LinkedIn Job Application Automation.
 
@@ -9,85 +9,149 @@ jobs page, searches for jobs based on a keyword and location, and if an "Easy Ap
 button is present, processes the application questions and submits the application.
 """
 
-import difflib
+import json
 import logging
 import os
-import time
-from typing import Dict
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 
-from selenium import webdriver
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from db_handler import get_db_connection
-
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[logging.StreamHandler()]
+from browser_pool import pool
+from common import (
+    DEFAULT_BROWSER,
+    NEGATIVE_WAIT_TIMEOUT,
+    PROFILE_ROOT,
+    RESUME_PATH,
+    apply_to_job_links,
+    apply_to_job_links_worker,
+    ask_user,
+    click_element,
+    click_locator,
+    fast_type,
+    configure_logging,
+    find_element_fuzzy,
+    make_wait,
+    process_application_questions,
+    read_secrets,
+    resume_available,
+    retry,
+    wait_for,
+    wait_until,
 )
-logger = logging.getLogger(__name__)
-
-
-def read_secrets(file_path: str = "secrets.config") -> Dict[str, str]:
-    """
-    Read LinkedIn credentials from a configuration file.
-    The file should contain lines like:
-        username_linkedin=your_email@example.com
-        password_linkedin=your_password
-    """
-    logger.debug("Reading secrets from %s", file_path)
-    secrets = {}
-    try:
-        with open(file_path, "r") as file:
-            for line in file:
-                line = line.strip()
-                if line and "=" in line:
-                    key, value = line.split("=", 1)
-                    secrets[key.strip()] = value.strip()
-        logger.info("Successfully read secrets from %s", file_path)
-    except Exception as e:
-        logger.error("Error reading secrets.config: %s", e)
-    return secrets
-
-
-def find_element_fuzzy(driver: WebDriver, target_placeholder: str, cutoff: float = 0.5):
-    """
-    Look for an <input> element whose placeholder attribute is a close match to target_placeholder.
-    Uses difflib.SequenceMatcher to compute a similarity ratio.
-    Returns the element if a candidate meets the cutoff; otherwise raises an exception.
-    """
-    candidates = driver.find_elements(By.TAG_NAME, "input")
-    best_match = None
-    best_ratio = 0.0
-    for elem in candidates:
-        placeholder = elem.get_attribute("placeholder")
-        if placeholder:
-            ratio = difflib.SequenceMatcher(None, placeholder.lower(), target_placeholder.lower()).ratio()
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_match = elem
-    logger.debug("Best match for placeholder '%s' is '%s' with ratio %f",
-                 target_placeholder, best_match.get_attribute("placeholder") if best_match else "None", best_ratio)
-    if best_match and best_ratio >= cutoff:
-        return best_match
-    else:
-        raise Exception(f"No element with placeholder close to '{target_placeholder}' found (best ratio: {best_ratio})")
 
+configure_logging()
+logger = logging.getLogger(__name__)
 
-def click_element(driver: WebDriver, element):
-    """
-    Attempt a normal click on the element; if that fails, use JavaScript to click.
-    """
-    try:
-        element.click()
-    except Exception as e:
-        logger.debug("Standard click failed: %s; using JavaScript click", e)
-        driver.execute_script("arguments[0].click();", element)
+QUESTION_GROUP_CSS = "div.jobs-easy-apply-form-section__group"
+
+# Login page elements.
+FEED_LINK = (By.CSS_SELECTOR, "a[href*='/feed/']")
+VERIFICATION_CODE_INPUT = (By.CSS_SELECTOR, "input[placeholder*='Verification code']")
+# True once the session has reached the feed, i.e. is logged in.
+LOGGED_IN = EC.any_of(EC.url_contains("/feed"), EC.presence_of_element_located(FEED_LINK))
+# Any input with a placeholder; the jobs page search boxes are found among these.
+SEARCH_INPUT = (By.CSS_SELECTOR, "input[placeholder]")
+# Confirmation heading shown after an application is submitted (matched by text, so XPath).
+APPLICATION_SENT = (By.XPATH, "//h2[contains(text(), 'Application sent')]")
+# Job page elements read by apply_to_open_job.
+JOB_DESCRIPTION = (By.CSS_SELECTOR, "div.jobs-box__html-content")
+EASY_APPLY_BUTTON = (By.CSS_SELECTOR, "button.jobs-apply-button")
+SUBMIT_BUTTON = (By.CSS_SELECTOR, "button[aria-label^='Submit application']")
+EASY_APPLY_MODAL = (By.CSS_SELECTOR, "div.jobs-easy-apply-modal")
+# Returns the job description text and the Easy Apply button (or null) in one call.
+JOB_PAGE_JS = """
+const description = document.querySelector('div.jobs-box__html-content');
+return {
+  description: description ? description.innerText : null,
+  easyApply: document.querySelector('button.jobs-apply-button')
+};
+"""
+# Returns the resume file input and the Submit application button (or nulls) in one call.
+APPLY_FORM_JS = """
+return {
+  fileInput: document.querySelector("input[type='file']"),
+  submit: document.querySelector("button[aria-label^='Submit application']")
+    || Array.from(document.querySelectorAll('button'))
+      .find(b => b.textContent.includes('Submit application')) || null
+};
+"""
+# LinkedIn's authentication cookie; present when a saved profile is still logged in.
+SESSION_COOKIE = "li_at"
+# Seconds to wait for the feed when checking whether saved cookies still log in.
+SESSION_CHECK_TIMEOUT = 5
+# Cookies of the last successful login, restored into sessions whose profile has none.
+# They include the li_at session token, so the file lives outside the repo and is private.
+COOKIE_CACHE_PATH = os.path.join(PROFILE_ROOT, "li_cookies.json")
+RESUME_INPUT = (By.CSS_SELECTOR, "input[type='file']")
+UPLOADED_DOCUMENT = (By.CSS_SELECTOR, "li.jobs-document-upload__uploaded-document")
+# Search result cards and the job page link inside each of them.
+JOB_CARD = (By.CSS_SELECTOR, "ul.jobs-search-results__list > li")
+JOB_LINK_CSS = "ul.jobs-search-results__list li a[href*='/jobs/view/']"
+# Marks a result card as Easy Apply: its apply-method footer item or the LinkedIn logo
+# LinkedIn puts next to "Easy Apply". Matched structurally, so it works in every locale.
+EASY_APPLY_MARKER_CSS = ".job-card-container__apply-method, li-icon[type='linkedin-bug'], svg[data-test-icon*='linkedin-bug']"
+# JS function: adds the href of every link matching linkCss to all, and to easy when its
+# result card carries markerCss, so postings that can only be applied to off-site are never opened.
+_COLLECT_LINKS = """const collect = (all, easy) => {
+  for (const a of document.querySelectorAll(linkCss)) {
+    all.add(a.href);
+    const card = a.closest('li');
+    if (!card || card.querySelector(markerCss)) easy.add(a.href);
+  }
+};"""
+# Returns {links, total}: the Easy Apply job links among the rendered cards and the number
+# of job links seen at all (arguments: link CSS, Easy Apply marker CSS).
+EASY_APPLY_LINKS_JS = """
+const [linkCss, markerCss] = arguments;
+""" + _COLLECT_LINKS + """
+const all = new Set(), easy = new Set();
+collect(all, easy);
+return {links: [...easy], total: all.size};
+"""
+# Async script: scrolls the virtualized results pane one screen at a time until its
+# height stops growing (or 50 steps), collecting the job links rendered at every step,
+# since cards scrolled out of view are emptied again (arguments: list CSS, link CSS,
+# Easy Apply marker CSS, callback). Returns {links, total} like EASY_APPLY_LINKS_JS.
+# Replaces a scroll-and-wait round-trip per card.
+JOB_LINKS_SCROLL_JS = """
+const [listCss, linkCss, markerCss, done] = arguments;
+""" + _COLLECT_LINKS + """
+const all = new Set(), easy = new Set();
+const finish = () => done({links: [...easy], total: all.size});
+const list = document.querySelector(listCss);
+const pane = list ? (list.closest('.jobs-search-results-list') || list) : null;
+if (!pane) { collect(all, easy); finish(); return; }
+let lastHeight = -1, steps = 0;
+const tick = () => {
+  collect(all, easy);
+  const atBottom = pane.scrollTop + pane.clientHeight >= pane.scrollHeight - 1;
+  if ((atBottom && pane.scrollHeight === lastHeight) || ++steps > 50) { finish(); return; }
+  lastHeight = pane.scrollHeight;
+  pane.scrollTop += pane.clientHeight;
+  setTimeout(tick, 300);
+};
+tick();
+"""
+JOB_LIST_CSS = "ul.jobs-search-results__list"
+
+# URL parts of the voyager (LinkedIn's internal API) request that returns the search hits.
+# The same endpoint also serves other card lists (e.g. recommendations), so both must match.
+VOYAGER_SEARCH_HITS = ("voyager/api/voyagerJobsDashJobCards", "q=jobSearch")
+# Job posting URNs inside voyager JSON, e.g. "urn:li:fsd_jobPosting:3812345678".
+VOYAGER_JOB_ID = re.compile(r"urn:li:(?:fsd_)?jobPosting:(\d+)")
+# Job id inside a job card URN, e.g. "urn:li:fsd_jobPostingCard:(3812345678,JOBS_SEARCH)".
+VOYAGER_CARD_ID = re.compile(r"urn:li:fsd_jobPostingCard:\((\d+),")
+# Footer item type of a job card that can be applied to with Easy Apply (locale independent).
+EASY_APPLY_FOOTER_TYPE = "EASY_APPLY_TEXT"
+JOB_VIEW_URL = "https://www.linkedin.com/jobs/view/{}/"
+# Job posting id inside a /jobs/view/ link (card links carry extra tracking parameters).
+JOB_VIEW_ID = re.compile(r"/jobs/view/(\d+)")
 
 
 def login_to_linkedin(driver: WebDriver) -> None:
@@ -103,24 +167,31 @@ def login_to_linkedin(driver: WebDriver) -> None:
     if not username or not password:
         raise Exception("LinkedIn credentials not found in secrets.config")
 
+    wait = make_wait(driver)
     driver.get("https://www.linkedin.com/login")
     logger.debug("Navigated to LinkedIn login page")
 
-    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "username")))
-    driver.find_element(By.ID, "username").send_keys(username)
+    wait.until(EC.element_to_be_clickable((By.ID, "username"))).send_keys(username)
     driver.find_element(By.ID, "password").send_keys(password)
     driver.find_element(By.ID, "password").send_keys(Keys.RETURN)
     logger.info("Submitted login credentials")
 
-    time.sleep(3)  # Wait for login to process
+    # Wait for login to process: either the feed or a verification prompt shows up.
+    try:
+        wait.until(EC.any_of(
+            EC.url_contains("/feed"),
+            EC.presence_of_element_located(FEED_LINK),
+            EC.presence_of_element_located(VERIFICATION_CODE_INPUT)
+        ))
+    except Exception as e:
+        logger.debug("Neither feed nor verification prompt appeared after login: %s", e)
 
     # Check for two-step verification prompt
     try:
-        twofa_field = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, "//input[contains(@placeholder, 'Verification code')]"))
-        )
+        # The wait above already covered the verification prompt, so absence is the common case.
+        twofa_field = wait_for(driver, VERIFICATION_CODE_INPUT, NEGATIVE_WAIT_TIMEOUT)
         if twofa_field:
-            code = input("Enter the two-step verification code from LinkedIn: ")
+            code = ask_user("Enter the two-step verification code from LinkedIn: ").result()
             twofa_field.send_keys(code)
             twofa_field.send_keys(Keys.RETURN)
             logger.debug("Submitted two-step verification code")
@@ -128,82 +199,281 @@ def login_to_linkedin(driver: WebDriver) -> None:
         logger.debug("No two-step verification prompt detected: %s", e)
 
     try:
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.XPATH, "//a[contains(@href, '/feed/')]"))
-        )
+        wait_until(driver, LOGGED_IN, 20)
         logger.info("Login successful!")
     except Exception as e:
         logger.error("Login might have failed. Current URL: %s", driver.current_url)
         raise Exception("Login did not complete successfully.") from e
+    _save_cookies(driver)
 
 
-def process_application_questions(driver: WebDriver) -> None:
+def _save_cookies(driver: WebDriver) -> None:
     """
-    Process application questions in the Easy Apply modal.
-    For each question, check the local SQLite database for an answer.
-    If not found, prompt the user and save the answer.
+    Write the session's cookies to COOKIE_CACHE_PATH for later runs and sessions.
+    The file is readable by the owner only, and is written to a temporary file first
+    and then renamed, so workers saving at the same time never leave partial JSON.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
     try:
-        question_groups = driver.find_elements(By.CSS_SELECTOR, "div.jobs-easy-apply-form-section__group")
-        logger.debug("Found %d question groups", len(question_groups))
-        for group in question_groups:
-            try:
-                label_elem = group.find_element(By.TAG_NAME, "label")
-                question_text = label_elem.text.strip()
-                if not question_text:
-                    continue
-                try:
-                    input_field = group.find_element(By.TAG_NAME, "input")
-                except Exception:
-                    input_field = group.find_element(By.TAG_NAME, "textarea")
-
-                cursor.execute("SELECT answer FROM questions WHERE question = ?", (question_text,))
-                row = cursor.fetchone()
-                if row:
-                    answer = row[0]
-                    logger.info("Using stored answer for question: %s", question_text)
-                else:
-                    answer = input(f"Enter answer for '{question_text}': ")
-                    cursor.execute("INSERT INTO questions (question, answer) VALUES (?, ?)", (question_text, answer))
-                    conn.commit()
-                    logger.info("Saved answer for question: %s", question_text)
-                input_field.clear()
-                input_field.send_keys(answer)
-            except Exception as qe:
-                logger.debug("Error processing question group: %s", qe)
+        os.makedirs(PROFILE_ROOT, exist_ok=True)
+        tmp_path = f"{COOKIE_CACHE_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(driver.get_cookies(), file)
+        os.replace(tmp_path, COOKIE_CACHE_PATH)
+        logger.debug("Saved LinkedIn cookies to %s", COOKIE_CACHE_PATH)
     except Exception as e:
-        logger.error("Error processing application questions: %s", e)
-    finally:
-        conn.close()
-        logger.debug("Closed questions database connection")
+        logger.debug("Could not save LinkedIn cookies: %s", e)
+
+
+def _restore_cookies(driver: WebDriver) -> bool:
+    """
+    Add the cookies saved by _save_cookies to the session (which must be on a
+    linkedin.com page) and check that they still log it in.
+    """
+    try:
+        with open(COOKIE_CACHE_PATH, encoding="utf-8") as file:
+            cookies = json.load(file)
+    except (OSError, ValueError):
+        return False
+    for cookie in cookies:
+        try:
+            driver.add_cookie(cookie)
+        except Exception as e:
+            logger.debug("Skipping saved cookie %s: %s", cookie.get("name"), e)
+    return driver.get_cookie(SESSION_COOKIE) is not None and _session_is_valid(driver)
 
 
-def apply_to_jobs(job_title: str, location: str, auto_apply: bool = True) -> None:
+def _session_is_valid(driver: WebDriver) -> bool:
+    """
+    Load the feed and check that the session's cookies still log it in.
+    An expired or revoked session redirects the feed to the login page.
+    """
+    driver.get("https://www.linkedin.com/feed/")
+    try:
+        wait_until(driver, LOGGED_IN, SESSION_CHECK_TIMEOUT)
+        return True
+    except Exception as e:
+        logger.debug("LinkedIn session cookie no longer logs in: %s", e)
+        return False
+
+
+def ensure_logged_in(driver: WebDriver) -> None:
+    """
+    Log in to LinkedIn unless the session already is: either this pooled session has
+    logged in before, or its persistent profile's li_at session cookie or the cookies
+    saved by an earlier login still log it in.
+    """
+    if pool.is_logged_in(driver, "linkedin"):
+        return
+    # Cookies can only be read for the current domain; robots.txt is the cheapest page there.
+    driver.get("https://www.linkedin.com/robots.txt")
+    if driver.get_cookie(SESSION_COOKIE) is not None and _session_is_valid(driver):
+        logger.info("Reusing the LinkedIn session saved in the browser profile")
+        # Keep the cookie cache current; worker sessions restore from it instead of logging in.
+        _save_cookies(driver)
+    elif _restore_cookies(driver):
+        logger.info("Restored the LinkedIn session from %s", COOKIE_CACHE_PATH)
+    else:
+        login_to_linkedin(driver)
+    pool.mark_logged_in(driver, "linkedin")
+
+
+def _drain_network_log(driver: WebDriver) -> list:
+    """
+    Return and clear the performance log entries recorded so far.
+    Returns an empty list for drivers without performance logging (e.g. Safari).
+    """
+    try:
+        return driver.get_log("performance")
+    except Exception as e:
+        logger.debug("Performance log unavailable: %s", e)
+        return []
+
+
+def unique_job_links(links: List[str]) -> List[str]:
+    """
+    Reduce scraped card links to one canonical /jobs/view/<id>/ URL per posting, in order.
+    Cards can contain several links to the same posting, each with its own tracking
+    parameters; links without a job id are kept as they are.
+    """
+    seen = {}
+    for link in links:
+        if not link:
+            continue
+        match = JOB_VIEW_ID.search(link)
+        seen.setdefault(JOB_VIEW_URL.format(match.group(1)) if match else link, None)
+    return list(seen)
+
+
+def search_hit_job_ids(body: str) -> List[str]:
+    """
+    Return the ids of the Easy Apply postings among the search hits of one voyager search
+    response, in result order. Only the hits' element list is read, so postings the payload
+    mentions elsewhere (sidebar, recommendations) are never picked up. Each hit's card is
+    either inlined or, in normalized responses, referenced by URN and listed in "included".
+    """
+    payload = json.loads(body)
+    data = payload.get("data") or payload
+    included = {item.get("entityUrn"): item for item in payload.get("included") or () if isinstance(item, dict)}
+    job_ids = []
+    for hit in data.get("elements") or ():
+        union = hit.get("jobCardUnion") or {}
+        card = union.get("jobPostingCard") or included.get(union.get("*jobPostingCard")) or {}
+        if not any(item.get("type") == EASY_APPLY_FOOTER_TYPE for item in card.get("footerItems") or ()):
+            continue
+        match = (VOYAGER_JOB_ID.search(card.get("*jobPosting") or card.get("jobPostingUrn") or "")
+                 or VOYAGER_CARD_ID.search(card.get("entityUrn") or ""))
+        if match:
+            job_ids.append(match.group(1))
+    return job_ids
+
+
+def job_links_from_network(driver: WebDriver) -> List[str]:
+    """
+    Build Easy Apply job page links from the search hits loaded since the log was last drained.
+    The search results arrive as JSON, so reading them avoids rendering and
+    scraping every result card. Returns an empty list if nothing could be read.
+    """
+    # Search hit responses in arrival order, and the requests whose bodies have fully
+    # arrived; getResponseBody fails for bodies that are still streaming.
+    request_ids = []
+    finished = set()
+    for entry in _drain_network_log(driver):
+        try:
+            message = json.loads(entry["message"])["message"]
+            method = message.get("method")
+            params = message["params"]
+            if method == "Network.loadingFinished":
+                finished.add(params["requestId"])
+            elif method == "Network.responseReceived" and all(
+                    part in params["response"]["url"] for part in VOYAGER_SEARCH_HITS):
+                request_ids.append(params["requestId"])
+        except Exception as e:
+            logger.debug("Skipping network log entry: %s", e)
+
+    job_ids = {}
+    for request_id in request_ids:
+        if request_id not in finished:
+            logger.debug("Skipping voyager response %s that had not finished loading", request_id)
+            continue
+        try:
+            body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})["body"]
+            hit_ids = search_hit_job_ids(body)
+        except Exception as e:
+            logger.debug("Could not read voyager response %s: %s", request_id, e)
+            continue
+        for job_id in hit_ids:
+            job_ids.setdefault(job_id, None)
+    return [JOB_VIEW_URL.format(job_id) for job_id in job_ids]
+
+
+def apply_to_open_job(driver: WebDriver, index: int, auto_apply: bool = True) -> None:
+    """
+    Apply to the job posting currently shown in the driver.
+    Reads the description, clicks Easy Apply if present, answers the application
+    questions, attaches the resume and submits. index is only used for logging.
+    """
+    wait = make_wait(driver)
+    try:
+        # (Optional) Extract a snippet of the job description.
+        try:
+            wait.until(EC.visibility_of_element_located(JOB_DESCRIPTION))
+        except Exception as e:
+            logger.error("Could not extract job description for job #%d: %s", index + 1, e)
+        # Read the description and look up the Easy Apply button in one round-trip.
+        job_page = driver.execute_script(JOB_PAGE_JS) or {}
+        description = job_page.get("description") or "Unknown"
+
+        # Check for the presence of an Easy Apply button.
+        easy_apply_button = job_page.get("easyApply")
+        if easy_apply_button is None:
+            # It may still be rendering; give it a short grace period.
+            try:
+                easy_apply_button = wait_for(driver, EASY_APPLY_BUTTON, NEGATIVE_WAIT_TIMEOUT)
+            except Exception:
+                easy_apply_button = None
+        if easy_apply_button:
+            logger.info("Easy Apply button found for job #%d", index + 1)
+            if auto_apply:
+                try:
+                    retry(lambda: click_locator(driver, EASY_APPLY_BUTTON))
+                    logger.debug("Clicked Easy Apply button for job #%d", index + 1)
+                except Exception as e:
+                    logger.error("Failed to click Easy Apply: %s", e)
+                # Wait for the Easy Apply modal to appear.
+                wait.until(EC.visibility_of_element_located(EASY_APPLY_MODAL))
+                process_application_questions(driver, QUESTION_GROUP_CSS)
+                # Look up the resume upload field and the submit button in one round-trip.
+                apply_form = driver.execute_script(APPLY_FORM_JS) or {}
+
+                # Optionally attach your resume; skip straight past forms without a file input.
+                if resume_available() and apply_form.get("fileInput") is not None:
+                    try:
+                        retry(lambda: driver.find_element(*RESUME_INPUT).send_keys(RESUME_PATH))
+                        logger.info("Attached resume from %s for job #%d", RESUME_PATH, index + 1)
+                        # Submitting before the upload finishes would send the application without it.
+                        try:
+                            wait_for(driver, UPLOADED_DOCUMENT, NEGATIVE_WAIT_TIMEOUT)
+                        except Exception as upload_error:
+                            logger.debug("Resume upload not confirmed for job #%d: %s", index + 1, upload_error)
+                    except Exception as resume_error:
+                        logger.debug("Could not attach resume for job #%d: %s", index + 1, resume_error)
+
+                # Attempt to submit the application.
+                try:
+                    submit_button = apply_form.get("submit")
+                    if submit_button is None:
+                        submit_button = retry(lambda: driver.find_element(*SUBMIT_BUTTON))
+                    click_element(driver, submit_button)
+                    # Done once the confirmation shows or the submit button is gone.
+                    wait.until(EC.any_of(
+                        EC.visibility_of_element_located(APPLICATION_SENT),
+                        EC.staleness_of(submit_button)
+                    ))
+                    logger.info("Submitted application for job #%d", index + 1)
+                except Exception as submit_error:
+                    logger.error("Could not submit application for job #%d: %s", index + 1, submit_error)
+            else:
+                logger.info("Auto-apply disabled for job #%d", index + 1)
+        else:
+            logger.info("Easy Apply not available for job #%d", index + 1)
+    except Exception as job_error:
+        logger.error("Error processing job #%d: %s", index + 1, job_error)
+
+
+def apply_to_jobs(job_title: str, location: str, auto_apply: bool = True, workers: int = 1,
+                  browser: str = DEFAULT_BROWSER) -> None:
     """
     Automate job search and application on LinkedIn.
     Searches for jobs matching the given job_title and location.
     If an Easy Apply button is available, processes the application questions and submits the application.
+    browser selects the driver from the browser pool ("chrome" runs headless, or "safari").
+    With workers > 1 the postings are split across that many browser sessions, each
+    opening its share of job links directly (requires a browser that allows several
+    automation sessions at once, e.g. the default headless "chrome"; Safari allows only one).
     """
     logger.info("Starting job application process for '%s' jobs in '%s'", job_title, location)
 
     try:
-        driver = webdriver.Safari()
-        logger.debug("Initialized Safari WebDriver")
+        # Only this search session reads the network log (see job_links_from_network).
+        driver = pool.acquire(browser, performance_log=True)
+        logger.debug("Acquired %s WebDriver from the browser pool", browser)
     except Exception as e:
-        logger.error("Failed to initialize Safari WebDriver: %s", e)
+        logger.error("Failed to initialize %s WebDriver: %s", browser, e)
         return
 
+    # Job link shards for the workers; filled only when workers > 1.
+    shards = []
     try:
-        # Log in to LinkedIn
-        login_to_linkedin(driver)
+        # Log in to LinkedIn unless this pooled session already has
+        ensure_logged_in(driver)
 
         # Navigate to the LinkedIn Jobs page
         driver.get("https://www.linkedin.com/jobs/")
         logger.debug("Navigated to LinkedIn Jobs page")
         driver.execute_script("window.scrollTo(0,0);")
-        wait = WebDriverWait(driver, 30)
+        wait = make_wait(driver)
+        wait.until(EC.presence_of_element_located(SEARCH_INPUT))
 
         # --- UPDATE THE TARGET STRINGS AS NEEDED ---
         # It appears that your page does not have an input with placeholder close to
@@ -214,7 +484,7 @@ def apply_to_jobs(job_title: str, location: str, auto_apply: bool = True) -> Non
         # Locate the keyword search box using fuzzy matching.
         try:
             keyword_box = find_element_fuzzy(driver, keyword_target, cutoff=0.5)
-            wait.until(EC.element_to_be_clickable((By.XPATH, f"//input[@placeholder='{keyword_box.get_attribute('placeholder')}']")))
+            wait.until(EC.element_to_be_clickable(keyword_box))
             logger.debug("Found keyword search box with placeholder: '%s'", keyword_box.get_attribute("placeholder"))
         except Exception as e:
             logger.error("Failed to locate keyword search box: %s", e)
@@ -223,7 +493,7 @@ def apply_to_jobs(job_title: str, location: str, auto_apply: bool = True) -> Non
         # Locate the location search box using fuzzy matching.
         try:
             location_box = find_element_fuzzy(driver, location_target, cutoff=0.5)
-            wait.until(EC.element_to_be_clickable((By.XPATH, f"//input[@placeholder='{location_box.get_attribute('placeholder')}']")))
+            wait.until(EC.element_to_be_clickable(location_box))
             logger.debug("Found location search box with placeholder: '%s'", location_box.get_attribute("placeholder"))
         except Exception as e:
             logger.error("Failed to locate location search box: %s", e)
@@ -236,7 +506,7 @@ def apply_to_jobs(job_title: str, location: str, auto_apply: bool = True) -> Non
             logger.error("Error clicking keyword box: %s", click_error)
             raise
         keyword_box.clear()
-        keyword_box.send_keys(job_title)
+        fast_type(driver, keyword_box, job_title)
         logger.info("Entered job title: '%s'", job_title)
 
         # Enter the location.
@@ -246,91 +516,64 @@ def apply_to_jobs(job_title: str, location: str, auto_apply: bool = True) -> Non
             logger.error("Error clicking location box: %s", click_error)
             raise
         driver.execute_script("arguments[0].value = '';", location_box)
-        location_box.send_keys(location)
+        fast_type(driver, location_box, location)
+        # Forget earlier traffic (e.g. recommended jobs) so only search responses are read.
+        _drain_network_log(driver)
         location_box.send_keys(Keys.RETURN)
         logger.info("Submitted search criteria for '%s' in '%s'", job_title, location)
 
         # Wait for job results to load.
         try:
-            jobs = wait.until(EC.presence_of_all_elements_located(
-                (By.XPATH, "//ul[contains(@class, 'jobs-search-results__list')]/li")
-            ))
-            logger.info("Found %d job postings", len(jobs))
+            wait.until(EC.presence_of_element_located(JOB_CARD))
+            # Prefer the search API responses; they list every posting without rendering the cards.
+            job_links = job_links_from_network(driver)
+            if job_links:
+                logger.debug("Read %d job postings from the search API responses", len(job_links))
+            else:
+                # Render every card and snapshot its Easy Apply job links in one script call so the postings
+                # can be opened directly (and split across workers) without stale card references.
+                try:
+                    scraped = driver.execute_async_script(
+                        JOB_LINKS_SCROLL_JS, JOB_LIST_CSS, JOB_LINK_CSS, EASY_APPLY_MARKER_CSS)
+                except Exception as scroll_error:
+                    logger.debug("Scrolling the results pane failed: %s; using the rendered cards", scroll_error)
+                    scraped = driver.execute_script(EASY_APPLY_LINKS_JS, JOB_LINK_CSS, EASY_APPLY_MARKER_CSS)
+                job_links = unique_job_links(scraped["links"])
+                if scraped["total"] and not job_links:
+                    logger.warning("None of the %d job links is on a card marked Easy Apply; "
+                                   "EASY_APPLY_MARKER_CSS may need updating", scraped["total"])
+            logger.info("Found %d job postings", len(job_links))
         except Exception as e:
             logger.error("Failed to locate job postings: %s", e)
             raise
-
-        # Process each job posting.
-        for index, job in enumerate(jobs):
-            logger.info("Processing job posting #%d", index + 1)
-            try:
-                driver.execute_script("arguments[0].scrollIntoView(true);", job)
-                time.sleep(1)
-                try:
-                    job.click()
-                    logger.debug("Clicked on job posting #%d using standard click", index + 1)
-                except Exception as click_error:
-                    logger.warning("Standard click failed: %s; using JS click", click_error)
-                    driver.execute_script("arguments[0].click();", job)
-                time.sleep(2)
-
-                # (Optional) Extract a snippet of the job description.
-                try:
-                    description_elem = driver.find_element(By.CSS_SELECTOR, "div.jobs-box__html-content")
-                    description = description_elem.text
-                except Exception as e:
-                    logger.error("Could not extract job description for job #%d: %s", index + 1, e)
-                    description = "Unknown"
-
-                # Check for the presence of an Easy Apply button.
-                easy_apply_buttons = driver.find_elements(By.XPATH, "//button[contains(@class, 'jobs-apply-button')]")
-                if easy_apply_buttons:
-                    logger.info("Easy Apply button found for job #%d", index + 1)
-                    if auto_apply:
-                        try:
-                            click_element(driver, easy_apply_buttons[0])
-                            logger.debug("Clicked Easy Apply button for job #%d", index + 1)
-                        except Exception as e:
-                            logger.error("Failed to click Easy Apply: %s", e)
-                        # Wait for the Easy Apply modal to appear.
-                        wait.until(EC.visibility_of_element_located(
-                            (By.XPATH, "//div[contains(@class, 'jobs-easy-apply-modal')]")
-                        ))
-                        time.sleep(1)
-                        process_application_questions(driver)
-
-                        # Optionally attach your resume.
-                        try:
-                            resume_upload = driver.find_element(By.XPATH, "//input[@type='file']")
-                            resume_path = os.path.abspath(os.path.join("Resources", "resume.pdf"))
-                            resume_upload.send_keys(resume_path)
-                            time.sleep(1)
-                            logger.info("Attached resume from %s for job #%d", resume_path, index + 1)
-                        except Exception as resume_error:
-                            logger.debug("No resume upload field found for job #%d: %s", index + 1, resume_error)
-
-                        # Attempt to submit the application.
-                        try:
-                            submit_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Submit application')]")
-                            click_element(driver, submit_button)
-                            time.sleep(2)
-                            logger.info("Submitted application for job #%d", index + 1)
-                        except Exception as submit_error:
-                            logger.error("Could not submit application for job #%d: %s", index + 1, submit_error)
-                    else:
-                        logger.info("Auto-apply disabled for job #%d", index + 1)
-                else:
-                    logger.info("Easy Apply not available for job #%d", index + 1)
-
-            except Exception as job_error:
-                logger.error("Error processing job #%d: %s", index + 1, job_error)
-                continue
+        indexed_links = [(index, link) for index, link in enumerate(job_links) if link]
+
+        if workers > 1:
+            # Applied to by the workers once the search session is back in the pool.
+            shards = [indexed_links[i::workers] for i in range(workers)]
+            logger.info("Processing %d job postings with %d workers", len(indexed_links), workers)
+        else:
+            # Process each job posting.
+            # This session records the performance log; drop each job page's events instead
+            # of letting them pile up in chromedriver.
+            apply_to_job_links(driver, indexed_links, apply_to_open_job, auto_apply,
+                               before_each=_drain_network_log)
 
     except Exception as main_error:
         logger.error("An error occurred during the job search process: %s", main_error)
     finally:
-        driver.quit()
-        logger.info("Closed browser session.")
+        pool.release(driver)
+        logger.info("Returned browser session to the pool.")
+
+    # The search session is back in the pool for the next search; workers use sessions
+    # without the performance log.
+    if not shards:
+        return
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for shard in shards:
+            if shard:
+                executor.submit(apply_to_job_links_worker, shard, auto_apply, browser,
+                                apply_to_open_job, ensure_logged_in)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,55 @@
+"""
+settings.py
+
+Logging setup and the secrets.config reader.
+
+Kept free of Selenium so modules that only need settings (e.g. tracker_updater.py)
+can import them without loading the browser automation helpers in common.py.
+"""
+
+import logging
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
+logger = logging.getLogger(__name__)
+
+
+def configure_logging() -> None:
+    """
+    Configure root logging once. Repeated calls (one per importing module) do not
+    add extra handlers, so every log line is emitted only once.
+    """
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.DEBUG,
+            format="%(asctime)s [%(levelname)s] %(message)s",
+            handlers=[logging.StreamHandler()]
+        )
+
+
+# Matches one "key=value" line; surrounding spaces are trimmed and '#' comments skipped.
+_SECRET_LINE = re.compile(r"^[ \t]*([^=\s#]+)[ \t]*=[ \t]*(.*?)[ \t]*$", re.MULTILINE)
+
+
+@lru_cache(maxsize=4)
+def read_secrets(file_path: str = "secrets.config") -> Mapping[str, str]:
+    """
+    Read configuration values from a secrets file.
+    The file should contain key=value lines, for example:
+        username_linkedin=your_email@example.com
+        password_linkedin=your_password
+    Blank lines and lines starting with '#' are ignored.
+    The file is parsed once per process; the cached result is returned as a
+    read-only mapping so callers cannot mutate it.
+    """
+    logger.debug("Reading secrets from %s", file_path)
+    secrets = {}
+    try:
+        with open(file_path, "r") as file:
+            secrets = dict(_SECRET_LINE.findall(file.read()))
+        logger.info("Successfully read secrets from %s", file_path)
+    except Exception as e:
+        logger.error("Error reading secrets.config: %s", e)
+    return MappingProxyType(secrets)
@@ -31,6 +31,113 @@ ChromeDriverManager = ChromeDriverManager.ChromeDriverManager
 
 log = logging.getLogger(__name__)
 
+# LinkedIn search results per page; next_jobs_page advances &start= by this much.
+JOBS_PER_PAGE = 25
+# Maximum number of HTTP connections kept open to chromedriver.
+DRIVER_CONNECTION_POOL_SIZE = 20
+
+# (keyword, answer) pairs used by ans_question, in priority order: when a question
+# contains several keywords the one listed first wins. None means the configured salary.
+QUESTION_ANSWERS = [
+    ("how many", "1"),
+    ("experience", "1"),
+    ("sponsor", "No"),
+    ("do you ", "Yes"),
+    ("have you ", "Yes"),
+    ("US citizen", "Yes"),
+    ("are you ", "Yes"),
+    ("salary", None),
+    ("can you", "Yes"),
+    ("gender", "Male"),
+    ("race", "Wish not to answer"),
+    ("lgbtq", "Wish not to answer"),
+    ("ethnicity", "Wish not to answer"),
+    ("nationality", "Wish not to answer"),
+    ("government", "I do not wish to self-identify"),
+    ("are you legally", "Yes"),
+]
+_QUESTION_PRIORITY = {keyword: i for i, (keyword, _) in enumerate(QUESTION_ANSWERS)}
+# One scan finds every keyword occurrence; the zero-width lookahead lets overlapping
+# keywords match, and at each position the alternation tries keywords in priority order.
+_QUESTION_KEYWORDS = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword, _ in QUESTION_ANSWERS) + "))"
+)
+
+# Radio-button selector for each canned answer, built once instead of per question.
+RADIO_ANSWER_CSS = {
+    answer: "input[type='radio'][value='{}']".format(answer)
+    for _, answer in QUESTION_ANSWERS if answer is not None
+}
+
+
+def radio_css(answer) -> str:
+    css = RADIO_ANSWER_CSS.get(answer)
+    if css is None:
+        css = "input[type='radio'][value='{}']".format(answer)
+    return css
+
+
+# Pull the job title (minus a "(3)" notification prefix) and company out of the page title.
+_JOB_TITLE_RE = re.compile(r"\(?\d?\)?\s?(\w.*)")
+_COMPANY_RE = re.compile(r"(\w.*)")
+
+# Returns [job id, card text] for every job card in the search results.
+JOB_CARDS_JS = (
+    "return Array.from(document.querySelectorAll('div[data-job-id]'))"
+    ".map(c => [c.getAttribute('data-job-id'), c.innerText]);"
+)
+
+# Scrolls the results pane (arguments[0]) down one screen; returns True if it was
+# already at the bottom, i.e. there is nothing left to render.
+SCROLL_RESULTS_JS = """
+const pane = arguments[0];
+const atBottom = pane.scrollTop + pane.clientHeight >= pane.scrollHeight - 1;
+pane.scrollBy(0, pane.clientHeight);
+return atBottom;
+"""
+# Seconds to wait for new cards to render after scrolling the results pane.
+CARD_WAIT_TIMEOUT = 2
+
+# Returns [question text, input kind] for each form field passed in arguments[0];
+# kind is "radio", "multi", "text" or "" when no known input is found.
+FIELD_DETAILS_JS = """
+return arguments[0].map(f => [
+  f.innerText,
+  f.querySelector("input[type='radio']") ? 'radio'
+    : f.querySelector("[id*='text-entity-list-form-component']") ? 'multi'
+    : f.querySelector('.artdeco-text-input--input') ? 'text' : ''
+]);
+"""
+
+# Text-node matches for status banners; cheaper than downloading page_source to search it.
+APPLIED_NOTICE_LOCATOR = (By.XPATH, "//*[text()[contains(., 'You applied on')]]")
+APPLICATION_SENT_LOCATOR = (By.XPATH, "//*[text()[contains(., 'application was sent')]]")
+
+# Upload prompts shown on the resume / cover letter steps.
+UPLOAD_RESUME_LOCATOR = (By.XPATH, '//span[text()="Upload resume"]')
+UPLOAD_CV_LOCATOR = (By.XPATH, '//span[text()="Upload cover letter"]')
+
+# CSS for each kind of element send_resume reacts to on an Easy Apply step.
+STEP_CSS = {
+    "submit": "button[aria-label='Submit application']",
+    "error": ".artdeco-inline-feedback__message",
+    "next": "button[aria-label='Continue to next step']",
+    "review": "button[aria-label='Review your application']",
+    "follow": "label[for='follow-company-checkbox']",
+}
+# Matches any of the above; used to wait for the next step to render.
+STEP_ANY_CSS = ", ".join(STEP_CSS.values())
+# Upper bound (seconds) for waits between Easy Apply steps.
+STEP_WAIT_TIMEOUT = 5
+# Returns {kind: [elements]} for every selector in arguments[0] in a single round-trip.
+STEP_ELEMENTS_JS = """
+const found = {};
+for (const [kind, css] of Object.entries(arguments[0])) {
+  found[kind] = Array.from(document.querySelectorAll(css));
+}
+return found;
+"""
+
 
 def setupLogger() -> None:
     dt: str = datetime.strftime(datetime.now(), "%m_%d_%y %H_%M_%S ")
@@ -91,11 +198,15 @@ class EasyApplyBot:
         self.salary = salary
         self.rate = rate
         # self.profile_path = profile_path
-        past_ids: list | None = self.get_appliedIDs(filename)
-        self.appliedJobIDs: list = past_ids if past_ids != None else []
+        past_ids: set | None = self.get_appliedIDs(filename)
+        # Job IDs applied to recently (and during this run); checked before opening a job page.
+        self.appliedJobIDs: set = past_ids if past_ids != None else set()
         self.filename: str = filename
         self.options = self.browser_options()
         self.browser = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=self.options)
+        self.widen_connection_pool()
+        # Misses must return at once; every wait for an element goes through self.wait.
+        self.browser.implicitly_wait(0)
         self.wait = WebDriverWait(self.browser, 30)
         self.blacklist = blacklist
         self.blackListTitles = blackListTitles
@@ -109,18 +220,18 @@ class EasyApplyBot:
             "review": (By.CSS_SELECTOR, "button[aria-label='Review your application']"),
             "submit": (By.CSS_SELECTOR, "button[aria-label='Submit application']"),
             "error": (By.CLASS_NAME, "artdeco-inline-feedback__message"),
-            "upload_resume": (By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-resume')]"),
-            "upload_cv": (By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-cover-letter')]"),
+            "upload_resume": (By.CSS_SELECTOR, "[id*='jobs-document-upload-file-input-upload-resume']"),
+            "upload_cv": (By.CSS_SELECTOR, "[id*='jobs-document-upload-file-input-upload-cover-letter']"),
             "follow": (By.CSS_SELECTOR, "label[for='follow-company-checkbox']"),
             "upload": (By.NAME, "file"),
             "search": (By.CLASS_NAME, "jobs-search-results-list"),
-            "links": ("xpath", '//div[@data-job-id]'),
+            "links": (By.CSS_SELECTOR, "div[data-job-id]"),
             "fields": (By.CLASS_NAME, "jobs-easy-apply-form-section__grouping"),
             "radio_select": (By.CSS_SELECTOR, "input[type='radio']"), #need to append [value={}].format(answer)
-            "multi_select": (By.XPATH, "//*[contains(@id, 'text-entity-list-form-component')]"),
+            "multi_select": (By.CSS_SELECTOR, "[id*='text-entity-list-form-component']"),
             "text_select": (By.CLASS_NAME, "artdeco-text-input--input"),
             "2fa_oneClick": (By.ID, 'reset-password-submit-button'),
-            "easy_apply_button": (By.XPATH, '//button[contains(@class, "jobs-apply-button")]')
+            "easy_apply_button": (By.CSS_SELECTOR, "button.jobs-apply-button")
 
         }
 
@@ -139,7 +250,7 @@ class EasyApplyBot:
             df.to_csv(self.qa_file, index=False, encoding='utf-8')
 
 
-    def get_appliedIDs(self, filename) -> list | None:
+    def get_appliedIDs(self, filename) -> set | None:
         try:
             df = pd.read_csv(filename,
                              header=None,
@@ -149,13 +260,23 @@ class EasyApplyBot:
 
             df['timestamp'] = pd.to_datetime(df['timestamp'], format="%Y-%m-%d %H:%M:%S")
             df = df[df['timestamp'] > (datetime.now() - timedelta(days=2))]
-            jobIDs: list = list(df.jobID)
+            jobIDs: set = set(df.jobID.astype(str))
             log.info(f"{len(jobIDs)} jobIDs found")
             return jobIDs
         except Exception as e:
             log.info(str(e) + "   jobIDs could not be loaded from CSV {}".format(filename))
             return None
 
+    def widen_connection_pool(self, maxsize=DRIVER_CONNECTION_POOL_SIZE) -> None:
+        # Selenium keeps one pooled keep-alive connection to chromedriver; with more
+        # slots, back-to-back commands reuse sockets instead of reconnecting.
+        conn = getattr(self.browser.command_executor, "_conn", None)
+        if conn is None or not hasattr(conn, "connection_pool_kw"):
+            log.debug("Driver connection does not expose a urllib3 PoolManager; leaving it unchanged")
+            return
+        conn.connection_pool_kw["maxsize"] = maxsize
+        conn.clear()
+
     def browser_options(self):
         options = webdriver.ChromeOptions()
         options.add_argument("--start-maximized")
@@ -180,14 +301,14 @@ class EasyApplyBot:
         try:
             user_field = self.browser.find_element(By.ID, "username")
             pw_field = self.browser.find_element(By.ID, "password")
-            login_button = self.browser.find_element(By.XPATH, '//button[@type="submit"]')
+            login_button = self.browser.find_element(By.CSS_SELECTOR, "button[type='submit']")
 
             user_field.send_keys(username)
-            time.sleep(1)
             pw_field.send_keys(password)
-            time.sleep(1)
             login_button.click()
-            time.sleep(10)  # give it time to log in or prompt for 2FA
+            # give it time to log in or prompt for 2FA
+            if not self.wait_until(EC.any_of(EC.url_contains("/feed"), EC.url_contains("checkpoint")), 10):
+                log.info("Login did not reach the feed or a verification page yet")
         except TimeoutException:
             log.info("TimeoutException! Username/password field or login button not found")
 
@@ -234,43 +355,25 @@ class EasyApplyBot:
             try:
                 log.info(f"{(self.MAX_SEARCH_TIME - (time.time() - start_time)) // 60} minutes left in this search")
 
-                # sleep to make sure everything loads, add random to make us look human.
-                randoTime: float = random.uniform(1.5, 2.9)
-                log.debug(f"Sleeping for {round(randoTime, 1)}")
-                #time.sleep(randoTime)
-                self.load_page(sleep=0.5)
+                # next_jobs_page has already waited for the results pane to render.
 
                 # LinkedIn displays the search results in a scrollable <div> on the left side, we have to scroll to its bottom
 
                 # scroll to bottom
 
-                if self.is_present(self.locator["search"]):
-                    scrollresults = self.get_elements("search")
-                    #     self.browser.find_element(By.CLASS_NAME,
-                    #     "jobs-search-results-list"
-                    # )
-                    # Selenium only detects visible elements; if we scroll to the bottom too fast, only 8-9 results will be loaded into IDs list
-                    for i in range(300, 3000, 100):
-                        self.browser.execute_script("arguments[0].scrollTo(0, {})".format(i), scrollresults[0])
-                    scrollresults = self.get_elements("search")
-                    #time.sleep(1)
-
-                # get job links, (the following are actually the job card objects)
-                if self.is_present(self.locator["links"]):
-                    links = self.get_elements("links")
-                # links = self.browser.find_elements("xpath",
-                #     '//div[@data-job-id]'
-                # )
-
+                # The list is virtualized, so cards are collected as they render while scrolling
+                cards = self.collect_job_cards()
+                if cards:
                     jobIDs = {} #{Job id: processed_status}
-                
+
                     # children selector is the container of the job cards on the left
-                    for link in links:
-                            if 'Applied' not in link.text: #checking if applied already
-                                if link.text not in self.blacklist: #checking if blacklisted
-                                    jobID = link.get_attribute("data-job-id")
+                    for jobID, text in cards.items():
+                            if jobID in self.appliedJobIDs: #applied earlier, skip before opening it
+                                continue
+                            if 'Applied' not in text: #checking if applied already
+                                if text not in self.blacklist: #checking if blacklisted
                                     if jobID == "search":
-                                        log.debug("Job ID not found, search keyword found instead? {}".format(link.text))
+                                        log.debug("Job ID not found, search keyword found instead? {}".format(text))
                                         continue
                                     else:
                                         jobIDs[jobID] = "To be processed"
@@ -278,22 +381,43 @@ class EasyApplyBot:
                         self.apply_loop(jobIDs)
                     self.browser, jobs_per_page = self.next_jobs_page(position,
                                                                       location,
-                                                                      jobs_per_page, 
+                                                                      jobs_per_page + JOBS_PER_PAGE,
                                                                       experience_level=self.experience_level)
                 else:
                     self.browser, jobs_per_page = self.next_jobs_page(position,
                                                                       location,
-                                                                      jobs_per_page, 
+                                                                      jobs_per_page + JOBS_PER_PAGE,
                                                                       experience_level=self.experience_level)
 
 
             except Exception as e:
                 print(e)
+    def collect_job_cards(self) -> dict:
+        # Scroll the results pane a screen at a time, keeping {job id: card text} for every
+        # card that renders, until the pane is at the bottom or no new cards show up.
+        cards = {}
+        panes = self.get_elements("search")
+        while True:
+            for jobID, text in self.browser.execute_script(JOB_CARDS_JS):
+                cards.setdefault(jobID, text)
+            if not panes or self.browser.execute_script(SCROLL_RESULTS_JS, panes[0]):
+                return cards
+            rendered = self.wait_until(
+                lambda d: any(c[0] not in cards for c in d.execute_script(JOB_CARDS_JS)),
+                CARD_WAIT_TIMEOUT
+            )
+            if not rendered:
+                return cards
+
     def apply_loop(self, jobIDs):
         for jobID in jobIDs:
+            if jobID in self.appliedJobIDs:
+                log.info(f"Already applied to {jobID}, skipping")
+                continue
             if jobIDs[jobID] == "To be processed":
                 applied = self.apply_to_job(jobID)
                 if applied:
+                    self.appliedJobIDs.add(jobID)
                     log.info(f"Applied to {jobID}")
                 else:
                     log.info(f"Failed to apply to {jobID}")
@@ -305,16 +429,18 @@ class EasyApplyBot:
         # get job page
         self.get_job_page(jobID)
 
-        # let page load
-        time.sleep(1)
+        # let page load (returns early once the apply button is there)
+        self.wait_until(EC.presence_of_element_located(self.locator["easy_apply_button"]), 2)
 
         # get easy apply button
         button = self.get_easy_apply_button()
+        # read once; each .title access is a WebDriver round-trip
+        title = self.browser.title
 
 
         # word filter to skip positions not wanted
         if button is not False:
-            if any(word in self.browser.title for word in blackListTitles):
+            if any(word in title for word in blackListTitles):
                 log.info('skipping this application, a blacklisted keyword was found in the job position')
                 string_easy = "* Contains blacklisted keyword"
                 result = False
@@ -323,14 +449,14 @@ class EasyApplyBot:
                 log.info("Clicking the EASY apply button")
                 button.click()
                 clicked = True
-                time.sleep(1)
+                self.wait_until(EC.presence_of_element_located((By.CSS_SELECTOR, STEP_ANY_CSS)))
                 self.fill_out_fields()
                 result: bool = self.send_resume()
                 if result:
                     string_easy = "*Applied: Sent Resume"
                 else:
                     string_easy = "*Did not apply: Failed to send Resume"
-        elif "You applied on" in self.browser.page_source:
+        elif self.is_present(APPLIED_NOTICE_LOCATOR):
             log.info("You have already applied to this position.")
             string_easy = "* Already Applied"
             result = False
@@ -341,22 +467,23 @@ class EasyApplyBot:
 
 
         # position_number: str = str(count_job + jobs_per_page)
-        log.info(f"\nPosition {jobID}:\n {self.browser.title} \n {string_easy} \n")
+        log.info(f"\nPosition {jobID}:\n {title} \n {string_easy} \n")
 
-        self.write_to_file(button, jobID, self.browser.title, result)
+        self.write_to_file(button, jobID, title, result)
         return result
 
     def write_to_file(self, button, jobID, browserTitle, result) -> None:
         def re_extract(text, pattern):
-            target = re.search(pattern, text)
+            target = pattern.search(text)
             if target:
                 target = target.group(1)
             return target
 
         timestamp: str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         attempted: bool = False if button == False else True
-        job = re_extract(browserTitle.split(' | ')[0], r"\(?\d?\)?\s?(\w.*)")
-        company = re_extract(browserTitle.split(' | ')[1], r"(\w.*)")
+        title_parts = browserTitle.split(' | ')
+        job = re_extract(title_parts[0], _JOB_TITLE_RE)
+        company = re_extract(title_parts[1], _COMPANY_RE)
 
         toWrite: list = [timestamp, jobID, job, company, attempted, result]
         with open(self.filename, 'a+') as f:
@@ -367,7 +494,7 @@ class EasyApplyBot:
 
         job: str = 'https://www.linkedin.com/jobs/view/' + str(jobID)
         self.browser.get(job)
-        self.job_page = self.load_page(sleep=0.5)
+        self.job_page = self.load_page()
         return self.job_page
 
     def get_easy_apply_button(self):
@@ -404,12 +531,18 @@ class EasyApplyBot:
         return
 
 
+    def wait_until(self, condition, timeout=STEP_WAIT_TIMEOUT) -> bool:
+        # Explicit wait that returns False on timeout instead of raising.
+        try:
+            WebDriverWait(self.browser, timeout).until(condition)
+            return True
+        except TimeoutException:
+            return False
+
     def get_elements(self, type) -> list:
-        elements = []
+        # find_elements already returns [] when nothing matches, so one round-trip is enough.
         element = self.locator[type]
-        if self.is_present(element):
-            elements = self.browser.find_elements(element[0], element[1])
-        return elements
+        return self.browser.find_elements(element[0], element[1])
 
     def is_present(self, locator):
         return len(self.browser.find_elements(locator[0],
@@ -422,27 +555,15 @@ class EasyApplyBot:
 
         try:
             #time.sleep(random.uniform(1.5, 2.5))
-            next_locator = (By.CSS_SELECTOR,
-                            "button[aria-label='Continue to next step']")
-            review_locator = (By.CSS_SELECTOR,
-                              "button[aria-label='Review your application']")
-            submit_locator = (By.CSS_SELECTOR,
-                              "button[aria-label='Submit application']")
-            error_locator = (By.CLASS_NAME,"artdeco-inline-feedback__message")
-            upload_resume_locator = (By.XPATH, '//span[text()="Upload resume"]')
-            upload_cv_locator = (By.XPATH, '//span[text()="Upload cover letter"]')
-            # WebElement upload_locator = self.browser.find_element(By.NAME, "file")
-            follow_locator = (By.CSS_SELECTOR, "label[for='follow-company-checkbox']")
-
             submitted = False
             loop = 0
             while loop < 2:
-                time.sleep(1)
+                self.wait_until(EC.presence_of_element_located((By.CSS_SELECTOR, STEP_ANY_CSS)))
                 # Upload resume
-                if is_present(upload_resume_locator):
+                if is_present(UPLOAD_RESUME_LOCATOR):
                     #upload_locator = self.browser.find_element(By.NAME, "file")
                     try:
-                        resume_locator = self.browser.find_element(By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-resume')]")
+                        resume_locator = self.browser.find_element(*self.locator["upload_resume"])
                         resume = self.uploads["Resume"]
                         resume_locator.send_keys(resume)
                     except Exception as e:
@@ -451,9 +572,9 @@ class EasyApplyBot:
                         log.debug("Resume: " + resume)
                         log.debug("Resume Locator: " + str(resume_locator))
                 # Upload cover letter if possible
-                if is_present(upload_cv_locator):
+                if is_present(UPLOAD_CV_LOCATOR):
                     cv = self.uploads["Cover Letter"]
-                    cv_locator = self.browser.find_element(By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-cover-letter')]")
+                    cv_locator = self.browser.find_element(*self.locator["upload_cv"])
                     cv_locator.send_keys(cv)
 
                     #time.sleep(random.uniform(4.5, 6.5))
@@ -463,61 +584,80 @@ class EasyApplyBot:
                         button = self.wait.until(EC.element_to_be_clickable(element))
                         button.click()
 
-                if len(self.get_elements("submit")) > 0:
-                    elements = self.get_elements("submit")
+                # Fetch every step button/message in one round-trip instead of one query each.
+                step = self.browser.execute_script(STEP_ELEMENTS_JS, STEP_CSS)
+
+                if len(step["submit"]) > 0:
+                    elements = step["submit"]
                     for element in elements:
                         button = self.wait.until(EC.element_to_be_clickable(element))
                         button.click()
                         log.info("Application Submitted")
                         submitted = True
                         break
+                    if submitted:
+                        break
 
-                elif len(self.get_elements("error")) > 0:
-                    elements = self.get_elements("error")
-                    if "application was sent" in self.browser.page_source:
+                elif len(step["error"]) > 0:
+                    elements = step["error"]
+                    if self.is_present(APPLICATION_SENT_LOCATOR):
                         log.info("Application Submitted")
                         submitted = True
                         break
                     elif len(elements) > 0:
+                        skipped = False
                         while len(elements) > 0:
-                            log.info("Please answer the questions, waiting 5 seconds...")
-                            time.sleep(5)
+                            log.info("Please answer the questions, waiting up to 5 seconds...")
+                            # Return as soon as the errors clear or the modal closes instead of always sleeping.
+                            try:
+                                WebDriverWait(self.browser, 5).until(EC.any_of(
+                                    EC.invisibility_of_element_located(self.locator["error"]),
+                                    EC.presence_of_element_located(self.locator["easy_apply_button"])
+                                ))
+                            except TimeoutException:
+                                pass
                             elements = self.get_elements("error")
 
-                            for element in elements:
+                            if elements:
                                 self.process_questions()
 
-                            if "application was sent" in self.browser.page_source:
+                            if self.is_present(APPLICATION_SENT_LOCATOR):
                                 log.info("Application Submitted")
                                 submitted = True
                                 break
                             elif is_present(self.locator["easy_apply_button"]):
                                 log.info("Skipping application")
                                 submitted = False
+                                skipped = True
                                 break
+                        if submitted or skipped:
+                            break
                         continue
                         #add explicit wait
                     
                     else:
                         log.info("Application not submitted")
-                        time.sleep(2)
                         break
                     # self.process_questions()
 
-                elif len(self.get_elements("next")) > 0:
-                    elements = self.get_elements("next")
+                elif len(step["next"]) > 0:
+                    elements = step["next"]
                     for element in elements:
                         button = self.wait.until(EC.element_to_be_clickable(element))
                         button.click()
+                        # The step is re-rendered; wait for the old button to go away.
+                        self.wait_until(EC.staleness_of(button))
 
-                elif len(self.get_elements("review")) > 0:
-                    elements = self.get_elements("review")
+                elif len(step["review"]) > 0:
+                    elements = step["review"]
                     for element in elements:
                         button = self.wait.until(EC.element_to_be_clickable(element))
                         button.click()
+                        # The step is re-rendered; wait for the old button to go away.
+                        self.wait_until(EC.staleness_of(button))
 
-                elif len(self.get_elements("follow")) > 0:
-                    elements = self.get_elements("follow")
+                elif len(step["follow"]) > 0:
+                    elements = step["follow"]
                     for element in elements:
                         button = self.wait.until(EC.element_to_be_clickable(element))
                         button.click()
@@ -530,90 +670,41 @@ class EasyApplyBot:
 
         return submitted
     def process_questions(self):
-        time.sleep(1)
+        self.wait_until(EC.presence_of_element_located(self.locator["fields"]))
         form = self.get_elements("fields") #self.browser.find_elements(By.CLASS_NAME, "jobs-easy-apply-form-section__grouping")
-        for field in form:
-            question = field.text
+        # question text and input type of every field in one round-trip
+        details = self.browser.execute_script(FIELD_DETAILS_JS, form)
+        for field, (question, kind) in zip(form, details):
             answer = self.ans_question(question.lower())
-            #radio button
-            if self.is_present(self.locator["radio_select"]):
-                try:
-                    input = field.find_element(By.CSS_SELECTOR, "input[type='radio'][value={}]".format(answer))
-                    input.execute_script("arguments[0].click();", input)
-                except Exception as e:
-                    log.error(e)
-                    continue
-            #multi select
-            elif self.is_present(self.locator["multi_select"]):
-                try:
-                    input = field.find_element(self.locator["multi_select"])
+            try:
+                #radio button
+                if kind == "radio":
+                    input = field.find_element(By.CSS_SELECTOR, radio_css(answer))
+                    self.browser.execute_script("arguments[0].click();", input)
+                #multi select
+                elif kind == "multi":
+                    input = field.find_element(*self.locator["multi_select"])
                     input.send_keys(answer)
-                except Exception as e:
-                    log.error(e)
-                    continue
-            # text box
-            elif self.is_present(self.locator["text_select"]):
-                try:
-                    input = field.find_element(self.locator["text_select"])
+                # text box
+                elif kind == "text":
+                    input = field.find_element(*self.locator["text_select"])
                     input.send_keys(answer)
-                except Exception as e:
-                    log.error(e)
-                    continue
-
-            elif self.is_present(self.locator["text_select"]):
-               pass
-
-            if "Yes" or "No" in answer: #radio button
-                try: #debug this
-                    input = form.find_element(By.CSS_SELECTOR, "input[type='radio'][value={}]".format(answer))
-                    form.execute_script("arguments[0].click();", input)
-                except:
-                    pass
-
-
-            else:
-                input = form.find_element(By.CLASS_NAME, "artdeco-text-input--input")
-                input.send_keys(answer)
+            except Exception as e:
+                log.error(e)
+                continue
 
     def ans_question(self, question): #refactor this to an ans.yaml file
         answer = None
-        if "how many" in question:
-            answer = "1"
-        elif "experience" in question:
-            answer = "1"
-        elif "sponsor" in question:
-            answer = "No"
-        elif 'do you ' in question:
-            answer = "Yes"
-        elif "have you " in question:
-            answer = "Yes"
-        elif "US citizen" in question:
-            answer = "Yes"
-        elif "are you " in question:
-            answer = "Yes"
-        elif "salary" in question:
-            answer = self.salary
-        elif "can you" in question:
-            answer = "Yes"
-        elif "gender" in question:
-            answer = "Male"
-        elif "race" in question:
-            answer = "Wish not to answer"
-        elif "lgbtq" in question:
-            answer = "Wish not to answer"
-        elif "ethnicity" in question:
-            answer = "Wish not to answer"
-        elif "nationality" in question:
-            answer = "Wish not to answer"
-        elif "government" in question:
-            answer = "I do not wish to self-identify"
-        elif "are you legally" in question:
-            answer = "Yes"
+        match = min((_QUESTION_PRIORITY[m.group(1)] for m in _QUESTION_KEYWORDS.finditer(question)), default=None)
+        if match is not None:
+            answer = QUESTION_ANSWERS[match][1]
+            if answer is None:
+                answer = self.salary
         else:
             log.info("Not able to answer question automatically. Please provide answer")
             #open file and document unanswerable questions, appending to it
-            answer = "user provided"
-            time.sleep(15)
+            # Block until the user replies instead of sleeping a fixed 15 s for a manual answer.
+            answer = input(f"Answer for '{question}' (Enter if filled in the browser): ").strip() or "user provided"
 
             # df = pd.DataFrame(self.answers, index=[0])
             # df.to_csv(self.qa_file, encoding="utf-8")
@@ -629,16 +720,12 @@ class EasyApplyBot:
 
         return answer
 
-    def load_page(self, sleep=1):
-        scroll_page = 0
-        while scroll_page < 4000:
-            self.browser.execute_script("window.scrollTo(0," + str(scroll_page) + " );")
-            scroll_page += 500
-            time.sleep(sleep)
-
-        if sleep != 1:
-            self.browser.execute_script("window.scrollTo(0,0);")
-            time.sleep(sleep)
+    def load_page(self, locator=None, timeout=STEP_WAIT_TIMEOUT):
+        # Wait for the page to finish loading (and for locator, if given, to be present)
+        # instead of scrolling it in fixed sleeps; result cards are rendered by collect_job_cards.
+        self.wait_until(lambda d: d.execute_script("return document.readyState") == "complete", timeout)
+        if locator is not None:
+            self.wait_until(EC.presence_of_element_located(locator), timeout)
 
         page = BeautifulSoup(self.browser.page_source, "lxml")
         return page
@@ -663,7 +750,7 @@ class EasyApplyBot:
             position + location + "&start=" + str(jobs_per_page) + experience_level_param)
         #self.avoid_lock()
         log.info("Loading next job page?")
-        self.load_page()
+        self.load_page(self.locator["search"])
         return (self.browser, jobs_per_page)
 
     # def finish_apply(self) -> None:
@@ -6,7 +6,8 @@ Module to update a Google Sheet with job application details.
 This module uses the editable Google Sheet URL provided in secrets.config under the key
 "spreadsheet_tracker". The sheet must be publicly editable ("Anyone with the link can edit").
 It attempts to use gspread in unauthenticated mode (by passing an empty credentials dictionary)
-to append a new row to the first worksheet.
+to append new rows to the first worksheet. Rows are buffered and sent in batches of
+SHEET_BATCH_SIZE (and once more at exit, or when flush_tracker() is called).
 
 If updating the Google Sheet fails (or if no URL is provided), this module falls back to
 updating a CSV file (Resources/applications_tracker.csv) with the application details.
@@ -19,114 +20,146 @@ Usage:
     Or run this module directly for testing.
 """
 
+import atexit
 import csv
 import logging
 import os
-from typing import List, Any
+import threading
+from typing import List, Any, Optional
 
 import requests
 import gspread
+from requests.adapters import HTTPAdapter
 
-# Configure logging.
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[logging.StreamHandler()]
-)
+from settings import configure_logging, read_secrets
+
+configure_logging()
 logger = logging.getLogger(__name__)
 
+CSV_TRACKER_PATH = os.path.abspath(os.path.join("Resources", "applications_tracker.csv"))
+CSV_HEADER = ["Company Name", "Job Title", "Job Level", "Salary Range", "Application Link", "Status"]
 
-def read_secrets(file_path: str = "secrets.config") -> dict:
-    """
-    Reads configuration values from a secrets file.
+# The CSV tracker stays open for the whole run and is closed at exit (see
+# _close_trackers), so rows cost a write and flush instead of an open/close each.
+_csv_file = None
+_csv_writer: Optional[Any] = None
+_csv_lock = threading.Lock()
 
-    The file should contain lines in the following format:
-        key=value
+# Worksheet opened by _get_sheet(), reused (with its HTTP session) while the URL is unchanged.
+_sheet = None
+_sheet_url: Optional[str] = None
 
-    Expected to include:
-      - spreadsheet_tracker: The editable URL of the Google Sheet.
+# Rows waiting to be appended to the Google Sheet with a single append_rows request.
+SHEET_BATCH_SIZE = 10
+_pending_rows: List[List[Any]] = []
+_pending_lock = threading.Lock()
 
-    Args:
-        file_path (str): Path to the secrets configuration file.
 
-    Returns:
-        dict: Dictionary of key/value pairs.
+def _get_sheet(sheet_url: str):
     """
-    secrets = {}
-    try:
-        with open(file_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line and "=" in line:
-                    key, value = line.split("=", 1)
-                    secrets[key.strip()] = value.strip()
-        logger.info("Secrets file '%s' read successfully.", file_path)
-    except Exception as e:
-        logger.error("Error reading secrets file '%s': %s", file_path, e)
-    return secrets
+    Returns the first worksheet of sheet_url. The requests session, gspread client and
+    opened worksheet are kept for the rest of the run, so later rows skip the TLS
+    handshake and the spreadsheet metadata fetch.
+    """
+    global _sheet, _sheet_url
+    if _sheet is None or _sheet_url != sheet_url:
+        session = requests.Session()
+        session.headers.update({"User-Agent": "Mozilla/5.0"})
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        # Pass an empty dictionary for credentials.
+        gc = gspread.Client(auth={})
+        gc.session = session
+        _sheet = gc.open_by_url(sheet_url).sheet1
+        _sheet_url = sheet_url
+    return _sheet
 
 
-def update_google_sheet(new_row: List[Any], sheet_url: str) -> bool:
+def update_google_sheet(new_rows: List[List[Any]], sheet_url: str) -> bool:
     """
-    Attempts to update the Google Sheet via the provided URL.
+    Attempts to append new_rows to the Google Sheet via the provided URL in one request.
 
     Uses gspread in unauthenticated mode by passing an empty credentials dictionary,
     and a custom requests session. The sheet must be publicly editable.
 
     Args:
-        new_row (List[Any]): The row data to append.
+        new_rows (List[List[Any]]): The rows to append.
         sheet_url (str): The editable Google Sheet URL.
 
     Returns:
         bool: True if the update succeeds, False otherwise.
     """
+    global _sheet
     try:
-        session = requests.Session()
-        session.headers.update({"User-Agent": "Mozilla/5.0"})
-        # Pass an empty dictionary for credentials.
-        gc = gspread.Client(auth={})
-        gc.session = session
-
-        sheet = gc.open_by_url(sheet_url).sheet1
-        sheet.append_row(new_row)
-        logger.info("Google Sheet updated successfully with row: %s", new_row)
+        _get_sheet(sheet_url).append_rows(new_rows, value_input_option="RAW")
+        logger.info("Google Sheet updated successfully with %d row(s)", len(new_rows))
         return True
     except Exception as e:
         logger.error("Error updating Google Sheet: %s", e)
+        _sheet = None  # Reopen the sheet on the next attempt
         return False
 
 
+def _get_csv_writer():
+    """
+    Returns the shared csv.writer for the tracker file, opening the file on first use
+    and writing the header if the file is new. Call with _csv_lock held.
+    """
+    global _csv_file, _csv_writer
+    if _csv_writer is None:
+        file_exists = os.path.isfile(CSV_TRACKER_PATH)
+        _csv_file = open(CSV_TRACKER_PATH, "a", newline="", encoding="utf-8")
+        _csv_writer = csv.writer(_csv_file)
+        if not file_exists:
+            _csv_writer.writerow(CSV_HEADER)
+    return _csv_writer
+
+
 def update_csv_tracker(new_row: List[Any]) -> None:
     """
     Updates the local CSV file with application information.
 
     The CSV file is located at Resources/applications_tracker.csv. If the file does not exist,
-    it will be created with the appropriate header.
+    it will be created with the appropriate header. Each row is flushed to the file
+    right away, so the record of a submitted application survives a crash.
 
     Args:
         new_row (List[Any]): The row data to append.
     """
-    csv_path = os.path.abspath(os.path.join("Resources", "applications_tracker.csv"))
-    file_exists = os.path.isfile(csv_path)
     try:
-        with open(csv_path, "a", newline="", encoding="utf-8") as csvfile:
-            writer = csv.writer(csvfile)
-            if not file_exists:
-                writer.writerow(["Company Name", "Job Title", "Job Level", "Salary Range", "Application Link", "Status"])
-            writer.writerow(new_row)
+        with _csv_lock:
+            _get_csv_writer().writerow(new_row)
+            _csv_file.flush()
         logger.info("Local CSV tracker updated successfully with row: %s", new_row)
     except Exception as e:
         logger.error("Error updating local CSV tracker: %s", e)
 
 
+def flush_tracker() -> None:
+    """
+    Sends the buffered rows to the Google Sheet in one request. If that fails,
+    the rows are written to the local CSV tracker instead.
+    """
+    with _pending_lock:
+        rows = _pending_rows[:]
+        _pending_rows.clear()
+    if not rows:
+        return
+    sheet_url = read_secrets().get("spreadsheet_tracker", "")
+    if not update_google_sheet(rows, sheet_url):
+        logger.info("Falling back to local CSV tracker update.")
+        for row in rows:
+            update_csv_tracker(row)
+
+
 def update_tracker(company: str, job_title: str, job_level: str, salary_range: str,
                    application_link: str, status: str) -> None:
     """
     Updates the tracker with application information.
 
     First, the function checks for an editable Google Sheet URL in secrets.config.
-    If a URL is provided, it attempts to update the Google Sheet. If the update fails
-    (or no URL is provided), it falls back to updating a local CSV file (Resources/applications_tracker.csv).
+    If a URL is provided, the row is buffered and sent with the next batch (see
+    flush_tracker). If the update fails (or no URL is provided), it falls back to
+    updating a local CSV file (Resources/applications_tracker.csv).
 
     Args:
         company (str): The company name.
@@ -137,20 +170,35 @@ def update_tracker(company: str, job_title: str, job_level: str, salary_range: s
         status (str): Application status.
     """
     new_row: List[Any] = [company, job_title, job_level, salary_range, application_link, status]
-    secrets = read_secrets()
-    sheet_url = secrets.get("spreadsheet_tracker", "")
+    # read_secrets() parses secrets.config once per process and caches the result.
+    sheet_url = read_secrets().get("spreadsheet_tracker", "")
     
     if sheet_url:
-        logger.info("Attempting to update Google Sheet using the provided URL.")
-        success = update_google_sheet(new_row, sheet_url)
-        if not success:
-            logger.info("Falling back to local CSV tracker update.")
-            update_csv_tracker(new_row)
+        with _pending_lock:
+            _pending_rows.append(new_row)
+            batch_full = len(_pending_rows) >= SHEET_BATCH_SIZE
+        logger.info("Queued row for the Google Sheet: %s", new_row)
+        if batch_full:
+            flush_tracker()
     else:
         logger.info("No spreadsheet_tracker URL provided in secrets.config; updating local CSV tracker.")
         update_csv_tracker(new_row)
 
 
+def _close_trackers() -> None:
+    """
+    Sends any buffered sheet rows, then closes the CSV tracker (which may have
+    received them as a fallback).
+    """
+    flush_tracker()
+    with _csv_lock:
+        if _csv_file is not None:
+            _csv_file.close()
+
+
+atexit.register(_close_trackers)
+
+
 if __name__ == "__main__":
     # For testing purposes.
     update_tracker(